@@ -1,10 +1,37 @@
-import pandas as pd
-import numpy as np
+import itertools
+import sys
+from pathlib import Path
 
-df = pd.read_excel("ECOMWITH YASIR STOCK PRODUCTS SHEET (1).xlsx")
+from xlsx_to_sqlite import open_sidecar
 
-print("Raw data for rows 44-48 (Excel rows 45-49), Column C:")
-print("="*80)
-for i in range(44, 49):
-    val = df.iloc[i, 2]  # Column C is index 2
-    print(f"Row {i+1} (Excel {i+2}): {val if not pd.isna(val) else '(empty)'}")
+try:  # python-calamine streams rows without the pandas/openpyxl stack
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+path = Path("ECOMWITH YASIR STOCK PRODUCTS SHEET (1).xlsx")
+
+# Column C of the five rows previously read via df.iloc[44:49, 2] (sheet rows 46-50)
+conn = open_sidecar(path)
+if conn is not None:
+    values = [val for (val,) in conn.execute("SELECT col_c FROM products WHERE excel_row BETWEEN 46 AND 50 ORDER BY excel_row")]
+    conn.close()
+elif CalamineWorkbook is not None:
+    sheet = CalamineWorkbook.from_path(str(path)).get_sheet_by_index(0)
+    values = [row[2] if len(row) > 2 else None for row in itertools.islice(sheet.iter_rows(), 45, 50)]
+else:
+    import pandas as pd
+
+    df = pd.read_excel(path, usecols="C", skiprows=45, nrows=5, header=None, engine="openpyxl")
+    values = df.iloc[:, 0].tolist()
+
+def is_empty(val):
+    # calamine reports blank cells as "", pandas as NaN
+    return val is None or val == "" or val != val
+
+lines = [
+    "Raw data for rows 44-48 (Excel rows 45-49), Column C:",
+    "="*80,
+    *(f"Row {i+1} (Excel {i+2}): {val if not is_empty(val) else '(empty)'}" for i, val in enumerate(values, start=44)),
+]
+sys.stdout.write("\n".join(lines) + "\n")
@@ -1,10 +1,27 @@
-from openpyxl import load_workbook
+import itertools
 
-wb = load_workbook('sheet_rows99-103_final.xlsx')
-ws = wb.active
+try:  # python-calamine streams rows without building openpyxl cell objects
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+path = 'sheet_rows99-103_final.xlsx'
 
 print("Checking rows around 99-104:")
-for row_num in range(99, 105):
-    col_d = ws.cell(row_num, 4).value  # Colour column
-    col_i = ws.cell(row_num, 9).value  # STATUS column
-    print(f"Row {row_num}: Colour={col_d}, STATUS={col_i}")
+if CalamineWorkbook is not None:
+    sheet = CalamineWorkbook.from_path(path).get_sheet_by_index(0)
+    # iter_rows is zero-based and spans every column, so D is 3 and I is 8
+    for row_num, row in enumerate(itertools.islice(sheet.iter_rows(), 98, 104), start=99):
+        col_d = row[3] if len(row) > 3 else None
+        col_i = row[8] if len(row) > 8 else None
+        print(f"Row {row_num}: Colour={col_d}, STATUS={col_i}")
+else:
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    ws = wb.active
+    # Columns D..I: Colour is the first cell, STATUS the sixth
+    for row_num, row in enumerate(ws.iter_rows(min_row=99, max_row=104, min_col=4, max_col=9, values_only=True), start=99):
+        col_d, col_i = row[0], row[5]
+        print(f"Row {row_num}: Colour={col_d}, STATUS={col_i}")
+    wb.close()
@@ -1,18 +1,41 @@
-import pandas as pd
+from pathlib import Path
 
-df = pd.read_excel("ECOMWITH YASIR STOCK PRODUCTS SHEET (1).xlsx")
-header = df.iloc[0]
-df.columns = [str(header.iloc[i]).strip() if isinstance(header.iloc[i], str) and header.iloc[i].strip() else col for i, col in enumerate(df.columns)]
-df = df.iloc[1:].reset_index(drop=True)
+from xlsx_to_sqlite import open_sidecar
+
+path = Path("ECOMWITH YASIR STOCK PRODUCTS SHEET (1).xlsx")
 
 print("Checking rows 44-47 (Excel rows 45-48):")
 print("="*100)
 
-for idx in [43, 44, 45, 46]:  # Zero-based, so 43 = Excel row 45
-    row = df.iloc[idx]
+conn = open_sidecar(path)
+if conn is not None:
+    letters = {label: letter for letter, label in conn.execute("SELECT letter, label FROM headers")}
+    status_col = "STATUS" if "STATUS" in letters else "INSTOCK/OUTOFSTOCK"
+    cols = ["Product Name", "Colour", "SIZE", status_col, "LISTING LINK"]
+    # Missing columns show as N/A
+    fields = ", ".join(f"col_{letters[col].lower()}" if col in letters else "'N/A'" for col in cols)
+    # Index 43 is sheet row 46: the first two sheet rows hold the headers
+    block = [
+        (excel_row - 3, *values)
+        for excel_row, *values in conn.execute(f"SELECT excel_row, {fields} FROM products WHERE excel_row IN (46, 47, 48, 49) ORDER BY excel_row")
+    ]
+    conn.close()
+else:
+    from excel_cache import load_stock_sheet
+
+    df = load_stock_sheet(path)
+
+    status_col = "STATUS" if "STATUS" in df.columns else "INSTOCK/OUTOFSTOCK"
+    cols = ["Product Name", "Colour", "SIZE", status_col, "LISTING LINK"]
+    # Missing columns show as N/A; plain ndarray rows unpack positionally,
+    # without per-field label lookups
+    values = df.iloc[43:47].reindex(columns=cols, fill_value="N/A").to_numpy()
+    block = ((idx, *row) for idx, row in enumerate(values, start=43))
+
+for idx, product_name, colour, size, status, link in block:
     print(f"\nRow {idx+2} (Excel row {idx+3}):")
-    print(f"  Product Name: {row.get('Product Name', 'N/A')}")
-    print(f"  Colour: {row.get('Colour', 'N/A')}")
-    print(f"  SIZE: {row.get('SIZE', 'N/A')}")
-    print(f"  STATUS: {row.get('STATUS', row.get('INSTOCK/OUTOFSTOCK', 'N/A'))}")
-    print(f"  LISTING LINK: {row.get('LISTING LINK', 'N/A')}")
+    print(f"  Product Name: {product_name}")
+    print(f"  Colour: {colour}")
+    print(f"  SIZE: {size}")
+    print(f"  STATUS: {status}")
+    print(f"  LISTING LINK: {link}")
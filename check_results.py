@@ -1,18 +1,14 @@
-import pandas as pd
+from excel_cache import load_sheet
 
 try:
-    df = pd.read_excel('test_row46.xlsx')
+    df = load_sheet('test_row46.xlsx')
     print('Results for target rows 45-49:')
     print('='*80)
-    target_rows = [45, 46, 47, 48, 49]  # Excel row numbers
-    for row_num in target_rows:
-        if row_num <= len(df):
-            row = df.iloc[row_num-1]  # Convert to 0-based index
-            print(f'Row {row_num}:')
-            print(f'  Color: {row.get("variation", "N/A")}')
-            print(f'  Detected Status: {row.get("detected_status", "N/A")}')
-            print(f'  Size: {row.get("size", "N/A")}')
-            print(f'  Error: {row.get("error", "None")}')
-            print()
+    cols = ["variation", "detected_status", "size", "error"]
+    # Excel rows 45-49 are 0-based rows 44-48; missing columns show as N/A
+    block = df.iloc[44:49].reindex(columns=cols, fill_value="N/A")
+    block.index = (block.index + 1).rename("Row")
+    block.columns = ["Color", "Detected Status", "Size", "Error"]
+    print(block.to_string())
 except Exception as e:
-    print(f'Error reading results: {e}')
\ No newline at end of file
+    print(f'Error reading results: {e}')
@@ -1,123 +1,207 @@
 """Debug script to test Green Cream selection for different sizes."""
 
-from playwright.sync_api import sync_playwright
-import time
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
+import asyncio
+import os
 
 url = "https://www.ebay.co.uk/itm/363486576357"
 
-def test_variant(size, color):
-    print(f"\n{'='*80}")
-    print(f"Testing: SIZE={size}, COLOR={color}")
-    print(f"{'='*80}")
-    
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(
-            viewport={"width": 1366, "height": 900},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-        )
-        page = context.new_page()
-        
-        page.goto(url, wait_until="domcontentloaded")
-        page.wait_for_timeout(2000)
-        
+# Set DEBUG_INSPECT=1 to keep each page open for manual inspection
+INSPECT = os.environ.get("DEBUG_INSPECT") == "1"
+
+# Set PLAYWRIGHT_CDP (e.g. http://localhost:9222) to attach to an already
+# running Chromium started with --remote-debugging-port instead of launching one
+CDP_ENDPOINT = os.environ.get("PLAYWRIGHT_CDP")
+
+# Most browser contexts checking pairs concurrently. Each context gets a
+# contiguous run of at least MIN_BATCH pairs, so a page load is always
+# shared; with fewer pairs than that one context walks them all.
+WORKERS = 2
+MIN_BATCH = 2
+
+# Reads every option's text and state attributes in one browser round-trip
+OPTION_SNAPSHOT_JS = """
+els => els.map(e => ({
+  text: e.innerText.trim(),
+  sku: e.getAttribute('data-sku-value-name'),
+  cls: e.getAttribute('class'),
+  aria: e.getAttribute('aria-disabled'),
+}))
+"""
+
+# Page weight the dropdown checks never look at. Stylesheets stay: the listbox
+# visibility waits depend on them, and ebaystatic.com serves the listbox JS.
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+BLOCKED_HOSTS = ("googletagmanager.com", "google-analytics.com", "doubleclick.net")
+
+async def block_heavy_resources(route):
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+def find_option(options, target):
+    """Return the index of the first option whose text contains ``target``, or None."""
+    needle = target.casefold()
+    return next((idx for idx, opt in enumerate(options) if needle in opt["text"].casefold()), None)
+
+async def select_size(containers, size, out):
+    """Pick ``size`` in the first listbox; returns False when it is not offered."""
+    out.append(f"\n{'='*80}")
+    out.append(f"Testing: SIZE={size}")
+    out.append(f"{'='*80}")
+
+    # Select SIZE
+    size_container = containers.nth(0)
+    size_button = size_container.locator("button.listbox-button__control").first
+    await size_button.click()
+
+    # Find size options
+    options_container = size_container.locator("div.listbox__options").first
+    await options_container.wait_for(state="visible", timeout=2000)
+    size_options = options_container.locator("div.listbox__option")
+
+    # Pin the option elements once; locator.nth() would re-query the DOM per use
+    size_handles = await size_options.element_handles()
+    size_data = await size_options.evaluate_all(OPTION_SNAPSHOT_JS)
+    out.append(f"\nSize options found: {len(size_data)}")
+
+    # Select the size
+    hit = find_option(size_data, size)
+    if hit is None:
+        out.append(f"\n  ✗ '{size}' not found in size options")
+        await size_button.press("Escape")
+        return False
+    out.append(f"  Selecting size: {size_data[hit]['text']}")
+    await size_handles[hit].click()
+
+    # eBay keeps analytics connections open, so wait for the size listbox
+    # to close rather than for networkidle
+    try:
+        await options_container.wait_for(state="hidden", timeout=3000)
+    except PlaywrightTimeoutError:
+        pass
+    return True
+
+async def check_color(containers, color, out):
+    out.append(f"\nChecking COLOR={color}")
+
+    # Select COLOR
+    color_container = containers.nth(1)
+    color_button = color_container.locator("button.listbox-button__control").first
+    await color_button.click()
+
+    # Find color options
+    color_options_container = color_container.locator("div.listbox__options").first
+    await color_options_container.wait_for(state="visible", timeout=2000)
+    color_options = color_options_container.locator("div.listbox__option")
+
+    color_handles = await color_options.element_handles()
+    color_data = await color_options.evaluate_all(OPTION_SNAPSHOT_JS)
+    out.append(f"\nColor options found: {len(color_data)}")
+
+    # Search for Green Cream
+    hit = find_option(color_data, color)
+    if hit is None:
+        out.append(f"\n  ✗ '{color}' not found in color options")
+        await color_button.press("Escape")
+        return
+
+    data = color_data[hit]
+    text = data["text"]
+    data_sku = data["sku"]
+    class_attr = data["cls"]
+    aria_disabled = data["aria"]
+
+    out.append(f"\n  Option {hit}:")
+    out.append(f"    Text: {text}")
+    out.append(f"    data-sku-value-name: {data_sku}")
+    out.append(f"    class: {class_attr}")
+    out.append(f"    aria-disabled: {aria_disabled}")
+
+    # Check if disabled
+    is_disabled = False
+    if class_attr and "listbox__option--disabled" in class_attr:
+        is_disabled = True
+        out.append(f"    ✗ DISABLED (class)")
+    if aria_disabled == "true":
+        is_disabled = True
+        out.append(f"    ✗ DISABLED (aria-disabled)")
+    if "(out of stock)" in text.casefold():
+        is_disabled = True
+        out.append(f"    ✗ DISABLED (text contains 'out of stock')")
+
+    if not is_disabled:
+        out.append(f"    ✓ AVAILABLE")
+        try:
+            await color_handles[hit].click()
+            # As for sizes, the click is done once the colour listbox closes
+            try:
+                await color_options_container.wait_for(state="hidden", timeout=3000)
+            except PlaywrightTimeoutError:
+                pass
+            out.append(f"    ✓ Successfully clicked")
+        except Exception as e:
+            out.append(f"    ✗ Failed to click: {e}")
+    else:
+        out.append(f"    ✗ Cannot click - option is disabled")
+        await color_button.press("Escape")
+
+async def test_variants(browser, variants):
+    """Check each (size, color) pair on a single load of the listing.
+
+    Output is buffered and printed as one block so concurrent runs don't interleave.
+    """
+    out = []
+    context = await browser.new_context(
+        viewport={"width": 1366, "height": 900},
+        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    )
+    await context.route("**/*", block_heavy_resources)
+    try:
+        page = await context.new_page()
+
+        await page.goto(url, wait_until="domcontentloaded")
+
         # Find variant containers
         containers = page.locator("div.vim.x-sku")
-        print(f"\nFound {containers.count()} variant containers")
-        
-        # Select SIZE
-        size_container = containers.nth(0)
-        size_button = size_container.locator("button.listbox-button__control").first
-        size_button.click()
-        page.wait_for_timeout(300)
-        
-        # Find size options
-        options_container = size_container.locator("div.listbox__options").first
-        size_options = options_container.locator("div.listbox__option")
-        
-        print(f"\nSize options found: {size_options.count()}")
-        
-        # Select the size
-        for idx in range(size_options.count()):
-            opt = size_options.nth(idx)
-            text = opt.inner_text().strip()
-            if size.lower() in text.lower():
-                print(f"  Selecting size: {text}")
-                opt.click()
-                page.wait_for_timeout(800)
-                break
-        
-        # Wait for page to update
+        await containers.first.wait_for(state="visible", timeout=10000)
+        out.append(f"\nFound {await containers.count()} variant containers")
+
+        # Picking another size resets the colour list, so no reload is needed
+        for size, color in variants:
+            # A missing size would leave the colours of the previous size
+            if await select_size(containers, size, out):
+                await check_color(containers, color, out)
+
+        if INSPECT:
+            out.append(f"\nPage will stay open for 10 seconds for inspection...")
+            await page.wait_for_timeout(10000)
+    finally:
+        await context.close()
+        print("\n".join(out))
+
+async def main(variants):
+    async with async_playwright() as p:
+        if CDP_ENDPOINT:
+            browser = await p.chromium.connect_over_cdp(CDP_ENDPOINT)
+        else:
+            browser = await p.chromium.launch(headless=not INSPECT)
         try:
-            page.wait_for_load_state("networkidle", timeout=3000)
-        except:
-            pass
-        page.wait_for_timeout(1000)
-        
-        # Select COLOR
-        color_container = containers.nth(1)
-        color_button = color_container.locator("button.listbox-button__control").first
-        color_button.click()
-        page.wait_for_timeout(300)
-        
-        # Find color options
-        color_options_container = color_container.locator("div.listbox__options").first
-        color_options = color_options_container.locator("div.listbox__option")
-        
-        print(f"\nColor options found: {color_options.count()}")
-        
-        # Search for Green Cream
-        found = False
-        for idx in range(color_options.count()):
-            opt = color_options.nth(idx)
-            text = opt.inner_text().strip()
-            data_sku = opt.get_attribute("data-sku-value-name")
-            class_attr = opt.get_attribute("class")
-            aria_disabled = opt.get_attribute("aria-disabled")
-            
-            if color.lower() in text.lower():
-                print(f"\n  Option {idx}:")
-                print(f"    Text: {text}")
-                print(f"    data-sku-value-name: {data_sku}")
-                print(f"    class: {class_attr}")
-                print(f"    aria-disabled: {aria_disabled}")
-                
-                # Check if disabled
-                is_disabled = False
-                if class_attr and "listbox__option--disabled" in class_attr:
-                    is_disabled = True
-                    print(f"    ✗ DISABLED (class)")
-                if aria_disabled == "true":
-                    is_disabled = True
-                    print(f"    ✗ DISABLED (aria-disabled)")
-                if "(out of stock)" in text.lower():
-                    is_disabled = True
-                    print(f"    ✗ DISABLED (text contains 'out of stock')")
-                
-                if not is_disabled:
-                    print(f"    ✓ AVAILABLE")
-                    try:
-                        opt.click()
-                        page.wait_for_timeout(1000)
-                        print(f"    ✓ Successfully clicked")
-                    except Exception as e:
-                        print(f"    ✗ Failed to click: {e}")
-                else:
-                    print(f"    ✗ Cannot click - option is disabled")
-                
-                found = True
-                break
-        
-        if not found:
-            print(f"\n  ✗ '{color}' not found in color options")
-        
-        # Keep browser open for inspection
-        print(f"\nBrowser will stay open for 10 seconds for inspection...")
-        page.wait_for_timeout(10000)
-        
-        browser.close()
+            # Each context loads the page once and walks a contiguous batch
+            count = max(1, min(WORKERS, len(variants) // MIN_BATCH))
+            size = max(1, -(-len(variants) // count))
+            batches = [variants[i:i + size] for i in range(0, len(variants), size)]
+            await asyncio.gather(*(test_variants(browser, batch) for batch in batches))
+        finally:
+            # Leave an attached browser running for the next invocation
+            if not CDP_ENDPOINT:
+                await browser.close()
 
 if __name__ == "__main__":
     # Test both sizes
-    test_variant("40 x 60 cm", "Green Cream")
-    test_variant("60 x 110 cm", "Green Cream")
+    asyncio.run(main([
+        ("40 x 60 cm", "Green Cream"),
+        ("60 x 110 cm", "Green Cream"),
+    ]))
@@ -1,6 +1,6 @@
-import pandas as pd
+from excel_cache import load_sheet
 
-df = pd.read_excel("ECOMWITH YASIR STOCK PRODUCTS SHEET (1).xlsx")
+df = load_sheet("ECOMWITH YASIR STOCK PRODUCTS SHEET (1).xlsx")
 
 print("First 50 rows, all columns:")
 print("="*120)
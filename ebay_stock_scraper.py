@@ -14,31 +14,80 @@ headers for navigating eBay bot protection.
 from __future__ import annotations
 
 import argparse
+import asyncio
+import csv
+import gzip
+import http.client
 import json
 import logging
+import random
+import re
+import sqlite3
 import sys
+import threading
 import time
-from dataclasses import dataclass
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
-from urllib import request as urllib_request
-from urllib.parse import parse_qs, urlparse
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urljoin, urlparse
 
 import pandas as pd
 from bs4 import BeautifulSoup
 
+from excel_cache import load_stock_sheet
+
 try:  # pragma: no cover - gracefully handle missing dependency
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:  # pragma: no cover - fallback path is exercised in runtime
     requests = None  # type: ignore
+    HTTPAdapter = None  # type: ignore
+
+try:  # pragma: no cover - optional asyncio HTTP client for --async runs
+    import httpx  # type: ignore
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore
+
+try:  # pragma: no cover - HTTP/2 support for httpx
+    import h2  # type: ignore  # noqa: F401
+except ImportError:  # pragma: no cover
+    h2 = None  # type: ignore
+
+try:  # pragma: no cover - optional faster JSON decoder
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:  # pragma: no cover - optional C-backed HTML parser, BeautifulSoup is the fallback
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser  # type: ignore
+except ImportError:  # pragma: no cover - selectolax < 0.3 only ships the Modest backend
+    try:
+        from selectolax.parser import HTMLParser  # type: ignore
+    except ImportError:
+        HTMLParser = None  # type: ignore
+
+try:  # pragma: no cover - C-backed parser between selectolax and html.parser
+    from lxml import etree  # type: ignore
+    from lxml import html as lxml_html  # type: ignore
+except ImportError:  # pragma: no cover
+    etree = None  # type: ignore
+    lxml_html = None  # type: ignore
+
+try:  # pragma: no cover - streaming xlsx writer, openpyxl is the fallback
+    import xlsxwriter  # type: ignore
+except ImportError:  # pragma: no cover
+    xlsxwriter = None  # type: ignore
 
 try:  # pragma: no cover - optional dependency for headful runs
-    from playwright.sync_api import (  # type: ignore
+    from playwright.async_api import (  # type: ignore
         TimeoutError as PlaywrightTimeoutError,
-        sync_playwright,
+        async_playwright,
     )
 except ImportError:  # pragma: no cover
-    sync_playwright = None  # type: ignore
+    async_playwright = None  # type: ignore
     PlaywrightTimeoutError = Exception  # type: ignore
 
 
@@ -49,29 +98,115 @@ else:
         """Lightweight HTTPError replacement when requests isn't available."""
 
 
-@dataclass
+@dataclass(slots=True)
 class SimpleResponse:
     """Minimal response object for urllib fallback."""
 
     status_code: int
     text: str
+    headers: Any = field(default_factory=dict)
+
+
+class UrllibStreamResponse:
+    """Body-streaming response returned by ``UrllibSession.get(stream=True)``."""
+
+    def __init__(self, conn: http.client.HTTPConnection, resp: http.client.HTTPResponse) -> None:
+        self._conn = conn
+        self._resp = resp
+        self.status_code = resp.status
+        self.headers = resp.headers
+        self.encoding = None
+
+    def iter_content(self, chunk_size: int = 8192) -> Iterable[bytes]:
+        encoding = (self.headers.get("Content-Encoding") or "").lower()
+        decoder = None
+        if encoding == "gzip":
+            decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            decoder = zlib.decompressobj()
+        while True:
+            chunk = self._resp.read(chunk_size)
+            if not chunk:
+                break
+            yield decoder.decompress(chunk) if decoder is not None else chunk
+        if decoder is not None:
+            yield decoder.flush()
+
+    def close(self) -> None:
+        if not self._resp.isclosed():
+            # Unread body bytes would corrupt the next response on this
+            # keep-alive connection, so drop the connection instead
+            self._conn.close()
+        self._resp.close()
 
 
 class UrllibSession:
-    """Session-like wrapper to mirror requests.Session for urllib usage."""
+    """Session-like wrapper to mirror requests.Session for urllib usage.
+
+    Keeps one keep-alive connection per host and thread, so consecutive
+    listings reuse the TCP/TLS connection instead of handshaking each time.
+    """
+
+    MAX_REDIRECTS = 5
 
     def __init__(self, headers: Dict[str, str], cookie_header: Optional[str]) -> None:
         self.headers = headers
         self.cookie_header = cookie_header
-
-    def get(self, url: str, timeout: float = 30.0) -> SimpleResponse:
-        req = urllib_request.Request(url, headers=self.headers)
+        self._local = threading.local()
+
+    def _connection(self, scheme: str, netloc: str, timeout: float, fresh: bool = False) -> http.client.HTTPConnection:
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        key = (scheme, netloc)
+        conn = connections.get(key)
+        if conn is None or fresh:
+            if conn is not None:
+                conn.close()
+            conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = connections[key] = conn_cls(netloc, timeout=timeout)
+        conn.timeout = timeout
+        return conn
+
+    def _request(
+        self, url: str, timeout: float, extra_headers: Optional[Dict[str, str]]
+    ) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        parsed = urlparse(url)
+        target = (parsed.path or "/") + (f"?{parsed.query}" if parsed.query else "")
+        headers = dict(self.headers)
+        headers.update(extra_headers or {})
         if self.cookie_header:
-            req.add_header("Cookie", self.cookie_header)
-        with urllib_request.urlopen(req, timeout=timeout) as resp:
-            status = getattr(resp, "status", 200)
-            body = resp.read().decode("utf-8", errors="ignore")
-        return SimpleResponse(status_code=status, text=body)
+            headers["Cookie"] = self.cookie_header
+        conn = self._connection(parsed.scheme, parsed.netloc, timeout)
+        try:
+            conn.request("GET", target, headers=headers)
+            return conn, conn.getresponse()
+        except (http.client.HTTPException, ConnectionError):
+            # The server closed an idle keep-alive connection; retry on a new one
+            conn = self._connection(parsed.scheme, parsed.netloc, timeout, fresh=True)
+            conn.request("GET", target, headers=headers)
+            return conn, conn.getresponse()
+
+    def get(
+        self, url: str, timeout: float = 30.0, headers: Optional[Dict[str, str]] = None, stream: bool = False
+    ) -> Union[SimpleResponse, UrllibStreamResponse]:
+        for _ in range(self.MAX_REDIRECTS + 1):
+            conn, resp = self._request(url, timeout, headers)
+            location = resp.getheader("Location")
+            if resp.status in (301, 302, 303, 307, 308) and location:
+                resp.read()
+                url = urljoin(url, location)
+                continue
+            break
+        if stream:
+            return UrllibStreamResponse(conn, resp)
+        body = resp.read()
+        encoding = (resp.getheader("Content-Encoding") or "").lower()
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding == "deflate":
+            body = zlib.decompress(body)
+        return SimpleResponse(status_code=resp.status, text=body.decode("utf-8", errors="ignore"), headers=resp.headers)
 
 LOGGER = logging.getLogger("ebay_stock_scraper")
 
@@ -87,6 +222,7 @@ DEFAULT_HEADERS = {
         "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp"
         ",image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7"
     ),
+    "Accept-Encoding": "gzip, deflate",
     "Connection": "keep-alive",
     "Cache-Control": "no-cache",
 }
@@ -100,6 +236,20 @@ CHALLENGE_MARKERS: Iterable[str] = (
 
 CHALLENGE_MARKERS_LOWER: Tuple[str, ...] = tuple(marker.lower() for marker in CHALLENGE_MARKERS)
 
+# Byte markers for scanning a body while it downloads. Each new chunk is
+# lower-cased and probed with plain substring checks, which beat a regex
+# alternation by an order of magnitude. Consecutive scans overlap by one
+# marker length, so a marker split across two chunks is still found.
+CHALLENGE_MARKERS_BYTES: Tuple[bytes, ...] = tuple(marker.encode() for marker in CHALLENGE_MARKERS_LOWER)
+CHALLENGE_OVERLAP = max(len(marker) for marker in CHALLENGE_MARKERS_LOWER)
+STREAM_CHUNK_SIZE = 8192
+
+# Statuses eBay answers with when throttling; treated like a challenge page
+THROTTLE_STATUSES = frozenset({429, 503})
+
+# Upper bound in seconds for a single backoff after a failed attempt
+MAX_BACKOFF = 60.0
+
 AVAILABILITY_JSON_KEYS: Iterable[str] = (
     "availability",
     "availabilityType",
@@ -114,10 +264,31 @@ AVAILABILITY_STRINGS = {
     "UNAVAILABLE": "OUT_OF_STOCK",
 }
 
+# Raw-text probes for the schema.org availability values embedded in listings
+SCHEMA_AVAILABILITY_TOKENS: Tuple[Tuple[str, str], ...] = (
+    ("schema.org/InStock", "IN_STOCK"),
+    ("schema.org/OutOfStock", "OUT_OF_STOCK"),
+)
+
+MAX_AGE_RE = re.compile(r"max-age=(\d+)")
 
-@dataclass
+# Product names carry the colour from the first colour word onwards
+# ("Rug Green Cream - Greekey" -> "Green Cream - Greekey")
+COLOR_WORDS = frozenset(
+    {"cream", "black", "grey", "gray", "brown", "beige", "blue", "green", "white", "red", "silver", "dark"}
+)
+COLOR_WORD_RE = re.compile(
+    r"(?:^|(?<=\s))(?:" + "|".join(sorted(COLOR_WORDS)) + r")(?=\s|\Z)",
+    re.IGNORECASE,
+)
+
+
+@dataclass(slots=True, frozen=True)
 class VariantRecord:
-    """Represents a single variant row from the spreadsheet."""
+    """Represents a single variant row from the spreadsheet.
+
+    Records are frozen once built, so worker threads can share them freely.
+    """
 
     row_index: int
     excel_row: int
@@ -131,25 +302,30 @@ class VariantRecord:
     item_number: Optional[str]
     listing_url: str
 
-    @property
-    def base_item_id(self) -> Optional[str]:
-        if not self.listing_url:
-            return None
-        parsed = urlparse(self.listing_url)
-        path_parts = parsed.path.rstrip("/").split("/")
-        try:
-            return next(part for part in reversed(path_parts) if part.isdigit())
-        except StopIteration:
-            return None
-
-    @property
-    def variation_id(self) -> Optional[str]:
-        parsed = urlparse(self.source_url)
-        query = parse_qs(parsed.query)
-        var_values = query.get("var")
-        if var_values:
-            return var_values[0]
+    # Derived from the URLs once, instead of re-parsing them on every access
+    base_item_id: Optional[str] = field(init=False)
+    variation_id: Optional[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        base_item_id = None
+        if self.listing_url:
+            path_parts = urlparse(self.listing_url).path.rstrip("/").split("/")
+            base_item_id = next((part for part in reversed(path_parts) if part.isdigit()), None)
+        var_values = parse_qs(urlparse(self.source_url).query).get("var")
+        # Frozen dataclasses only allow setting fields through object.__setattr__
+        object.__setattr__(self, "base_item_id", base_item_id)
+        object.__setattr__(self, "variation_id", var_values[0] if var_values else None)
+
+
+def color_from_name(name: str) -> Optional[str]:
+    """Return the colour named in a product title, or None if it names none."""
+    match = COLOR_WORD_RE.search(name)
+    if match is None:
         return None
+    remaining = " ".join(name[match.start():].split())
+    if " - " in remaining:
+        return remaining.split(" - ")[0].strip() + " - Greekey"
+    return remaining
 
 
 def parse_cookie_header(cookie_header: Optional[str]) -> Dict[str, str]:
@@ -174,37 +350,19 @@ def configure_logging(verbose: bool) -> None:
 
 
 def load_variants_from_excel(path: Path, limit: Optional[int] = None) -> List[VariantRecord]:
-    if not path.exists():
-        raise FileNotFoundError(path)
-
-    df = pd.read_excel(path)
+    # Parsed through the shared parquet sidecar, so re-runs against an
+    # unchanged workbook skip the XLSX parse entirely
+    df = load_stock_sheet(path)
     if df.empty:
         return []
 
-    header_row = df.iloc[0]
-    resolved_headers = []
-    for idx, col in enumerate(df.columns):
-        candidate = header_row.iloc[idx]
-        if isinstance(candidate, str) and candidate.strip():
-            resolved_headers.append(candidate.strip())
-        else:
-            resolved_headers.append(col)
-    df = df.iloc[1:].reset_index(drop=True)
-    df.columns = resolved_headers
-
-    def clean_cell_value(value: Any) -> Optional[str]:
-        if value is None:
-            return None
-        if isinstance(value, str):
-            cleaned = value.strip()
-            return cleaned or None
-        try:
-            if pd.isna(value):  # type: ignore[arg-type]
-                return None
-        except TypeError:
-            pass
-        text = str(value).strip()
-        return text or None
+    def clean_column(series: pd.Series) -> pd.Series:
+        """Strip every cell to text, mapping blanks and missing values to None."""
+        if pd.api.types.is_datetime64_any_dtype(series):
+            # Keep the full timestamp text that str() gives for each cell
+            series = series.astype(object)
+        text = series.astype("string").str.strip()
+        return text.astype(object).where(text.notna() & text.ne(""), None)
 
     column_map = {
         "Sr No": "sr_no",
@@ -225,115 +383,127 @@ def load_variants_from_excel(path: Path, limit: Optional[int] = None) -> List[Va
     }
 
     df = df.rename(columns=column_map)
+    # Sheets may carry several labels for one field (e.g. both SIZE and
+    # DIMENSIONS); the left-most column wins, as it did with itertuples
+    df = df.loc[:, ~df.columns.duplicated()]
 
     if "listing_url" not in df.columns:
         raise ValueError("Expected 'LISTING LINK' column to be present in the sheet.")
 
     df = df[df["listing_url"].notna()].copy()
     df["listing_url"] = df["listing_url"].astype(str).str.strip()
+    if limit is not None:
+        # Rows only ever inherit from earlier rows, so the tail can go up front
+        df = df.head(limit)
+
+    def column(name: str) -> pd.Series:
+        if name in df.columns:
+            return clean_column(df[name])
+        return pd.Series(None, index=df.index, dtype=object)
+
+    def raw_values(name: str) -> List[Any]:
+        if name in df.columns:
+            return df[name].tolist()
+        return [None] * len(df)
+
+    # Listings repeat once per variant row, so parse each distinct URL once
+    base_urls = {
+        url: urlparse(url)._replace(query="", fragment="").geturl()
+        for url in df["listing_url"].unique()
+    }
+    base_url = df["listing_url"].map(base_urls)
+
+    # A blank colour cell continues the last colour given for the same listing
+    color = column("variation").groupby(base_url, sort=False).ffill()
+    pack_type = column("pack_type")
+    dimensions = column("dimensions")
+    status_value = column("sheet_stock_status")
+    product_name = column("stock_name")
+
+    # If no color found directly, try to extract from product name
+    needs_color = color.isna() & product_name.notna()
+    extracted = product_name[needs_color].map(color_from_name)
+    color = color.where(color.notna(), extracted.reindex(color.index))
+    LOGGER.debug("Extracted %d colors from product names", int(extracted.notna().sum()))
+
+    size_value = dimensions.where(dimensions.notna(), pack_type)
+    placeholder = size_value.str.strip().str.lower().isin({"", "n/a", "na", "select", "rug"})
+    size_value = size_value.where(~placeholder, dimensions)
+    size_value = size_value.where(size_value.notna(), pack_type)
+
+    def as_list(series: pd.Series) -> List[Optional[str]]:
+        return series.astype(object).where(series.notna(), None).tolist()
 
     records: List[VariantRecord] = []
-    last_variation_by_listing: Dict[str, Optional[str]] = {}
-    for idx, row in enumerate(df.itertuples(index=False), start=1):
-        raw_url = getattr(row, "listing_url")
-        parsed_url = urlparse(raw_url)
-        base_url = parsed_url._replace(query="", fragment="").geturl()
-        color = clean_cell_value(getattr(row, "variation", None))
-        if color:
-            last_variation_by_listing[base_url] = color
-        else:
-            color = last_variation_by_listing.get(base_url)
-        pack_type = clean_cell_value(getattr(row, "pack_type", None))
-        dimensions = clean_cell_value(getattr(row, "dimensions", None))
-        status_value = clean_cell_value(getattr(row, "sheet_stock_status", None))
-        product_name = clean_cell_value(getattr(row, "stock_name", None))
-        
-        # If no color found directly, try to extract from product name
-        if not color and product_name:
-            parts = product_name.split()
-            for i, part in enumerate(parts):
-                if part.lower() in ["cream", "black", "grey", "gray", "brown", "beige", "blue", "green", "white", "red", "silver", "dark"]:
-                    remaining = " ".join(parts[i:])
-                    if " - " in remaining:
-                        color = remaining.split(" - ")[0].strip() + " - Greekey"
-                    else:
-                        color = remaining.strip()
-                    LOGGER.debug("Extracted color from product name: %s", color)
-                    break
-        
-        # Handle data inheritance: if no color found, check if we can inherit from previous rows
+    # Colour inheritance only looks at the unbroken run of rows sharing the
+    # current base URL, and takes the colour of the latest row in that run
+    # that offers one, so tracking that colour as rows go by is enough.
+    run_url: Optional[str] = None
+    run_color: Optional[str] = None
+    run_row = 0
+    rows = zip(
+        df["listing_url"].tolist(),
+        base_url.tolist(),
+        raw_values("sr_no"),
+        as_list(product_name),
+        as_list(color),
+        as_list(size_value),
+        as_list(dimensions),
+        as_list(pack_type),
+        as_list(status_value),
+        raw_values("item_number"),
+    )
+    for idx, (raw_url, base_url, sr_no, product_name, color, size_value, dimensions, pack_type, status_value, item_number) in enumerate(rows, start=1):
+        if base_url != run_url:
+            run_url, run_color = base_url, None
+
+        # Handle data inheritance: if no color found, inherit from previous rows
         # with the same base URL and a similar color pattern
-        if not color:
-            current_size = dimensions or pack_type
-            if current_size:
-                # Look back through previous rows with the same base listing URL
-                for prev_idx in range(idx - 1, 0, -1):
-                    prev_record = records[prev_idx - 1]  # records list is 0-indexed
-                    if prev_record.listing_url == base_url:
-                        # Check if previous record has a valid color that matches the pattern
-                        if prev_record.variation and " - Greekey" in prev_record.variation:
-                            # Check if sizes are related (same product, different sizes)
-                            current_size_clean = current_size.lower().replace(" cm", "").replace("cm", "").strip()
-                            prev_size_clean = prev_record.size.lower().replace(" cm", "").replace("cm", "").strip() if prev_record.size else ""
-                            
-                            # If previous record has a size (likely first row in color group),
-                            # inherit the color
-                            if prev_size_clean:
-                                color = prev_record.variation
-                                LOGGER.debug("Inherited color '%s' from previous row %d for size %s", 
-                                           color, prev_record.excel_row, current_size)
-                                break
-                        elif prev_record.stock_name and not color:
-                            # Try to extract color from previous record's product name
-                            prev_parts = prev_record.stock_name.split()
-                            for i, part in enumerate(prev_parts):
-                                if part.lower() in ["cream", "black", "grey", "gray", "brown", "beige", "blue", "green", "white", "red", "silver", "dark"]:
-                                    remaining = " ".join(prev_parts[i:])
-                                    if " - " in remaining:
-                                        inherited_color = remaining.split(" - ")[0].strip() + " - Greekey"
-                                    else:
-                                        inherited_color = remaining.strip()
-                                    color = inherited_color
-                                    LOGGER.debug("Extracted inherited color '%s' from previous row %d product name", 
-                                               color, prev_record.excel_row)
-                                    break
-                            if color:
-                                break
-                    # If we hit a different product (different URL), stop looking back
-                    elif prev_record.listing_url != base_url:
-                        break
-
-        size_value = dimensions or pack_type
-        if size_value and isinstance(size_value, str) and size_value.strip().lower() in {"", "n/a", "na", "select", "rug"}:
-            size_value = dimensions
-        if not size_value:
-            size_value = pack_type
+        if not color and (dimensions or pack_type) and run_color:
+            color = run_color
+            LOGGER.debug("Inherited color '%s' from previous row %d for size %s",
+                         color, run_row, dimensions or pack_type)
+
         records.append(
             VariantRecord(
                 row_index=idx,
                 excel_row=idx + 2,  # account for excel header row + header data row
                 source_url=raw_url,
-                sr_no=getattr(row, "sr_no", None),
+                sr_no=sr_no,
                 stock_name=product_name,
                 variation=color,
                 size=size_value,
                 dimensions=dimensions,
                 sheet_stock_status=status_value,
-                item_number=str(getattr(row, "item_number", "")) if getattr(row, "item_number", None) else None,
+                item_number=str(item_number) if item_number else None,
                 listing_url=base_url,
             )
         )
-        if limit is not None and len(records) >= limit:
-            break
+
+        # A "- Greekey" colour is handed on when the row has a size; other
+        # rows offer the colour named in their product title
+        if color and " - Greekey" in color:
+            offered = color if size_value and size_value.lower().replace(" cm", "").replace("cm", "").strip() else None
+        elif product_name:
+            offered = color_from_name(product_name)
+        else:
+            offered = None
+        if offered:
+            run_color, run_row = offered, idx + 2
     return records
 
 
-def create_session(headers: Dict[str, str], cookie_header: Optional[str]) -> Any:
+def create_session(headers: Dict[str, str], cookie_header: Optional[str], pool_size: int = 1) -> Any:
     if requests is None:
         return UrllibSession(headers=headers, cookie_header=cookie_header)
 
     session = requests.Session()
     session.headers.update(headers)
+    if pool_size > 1:
+        # Let every worker thread keep its own connection to the host
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
     cookies = parse_cookie_header(cookie_header)
     if cookies:
         session.cookies.update(cookies)
@@ -344,16 +514,217 @@ class ChallengeDetected(RuntimeError):
     """Raised when bot protection content is received."""
 
 
+class RateLimiter:
+    """Paces request start times per host, but only while that host pushes back.
+
+    Requests go out back to back until a host answers with a challenge or a
+    throttling status. From then on its requests are spaced ``interval``
+    seconds apart (plus jitter) until its recent block rate decays below
+    ``BLOCK_RATE_THRESHOLD``. Shared by the worker threads, so one worker
+    backing off pauses every request to that host.
+    """
+
+    BLOCK_RATE_DECAY = 0.8
+    BLOCK_RATE_THRESHOLD = 0.05
+
+    def __init__(self, interval: float) -> None:
+        self.interval = max(interval, 0.0)
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+        self._block_rate: Dict[str, float] = {}
+
+    def reserve(self, url: str) -> float:
+        """Claim the next request slot for the host of ``url``; return the seconds until it."""
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            if self._block_rate.get(host, 0.0) > self.BLOCK_RATE_THRESHOLD:
+                self._next_slot[host] = slot + self.interval + random.uniform(0, self.interval / 2)
+        return max(slot - time.monotonic(), 0.0)
+
+    def wait(self, url: str) -> None:
+        remaining = self.reserve(url)
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def record(self, url: str, blocked: bool) -> None:
+        """Fold the outcome of a request into the moving block rate of its host."""
+        host = urlparse(url).netloc
+        with self._lock:
+            rate = self._block_rate.get(host, 0.0) * self.BLOCK_RATE_DECAY
+            self._block_rate[host] = rate + (1 - self.BLOCK_RATE_DECAY if blocked else 0.0)
+
+    def back_off(self, url: str, seconds: float) -> None:
+        """Hold every request to the host of ``url`` for at least ``seconds``."""
+        host = urlparse(url).netloc
+        with self._lock:
+            resume = time.monotonic() + seconds
+            self._next_slot[host] = max(self._next_slot.get(host, resume), resume)
+
+
+def backoff_delay(delay: float, attempt: int) -> float:
+    """Exponential backoff for the ``attempt``-th failure, capped, with up to a second of jitter."""
+    return min(delay * (2 ** attempt), MAX_BACKOFF) + random.uniform(0, 1)
+
+
+class ListingCache:
+    """SQLite store of HTTP validators and detected statuses per listing URL.
+
+    Lets repeat runs send conditional GETs: a ``304 Not Modified`` reuses the
+    status detected last time, and entries still inside their
+    ``Cache-Control: max-age`` window skip the request entirely.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS listings ("
+            "listing_url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+            "max_age REAL, detected_status TEXT NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _row(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], Optional[float], str, float]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT etag, last_modified, max_age, detected_status, fetched_at FROM listings WHERE listing_url = ?",
+                (url,),
+            ).fetchone()
+
+    def fresh_status(self, url: str) -> Optional[str]:
+        """Return the cached status if the entry is still within its max-age window."""
+        row = self._row(url)
+        if row is None:
+            return None
+        _, _, max_age, detected_status, fetched_at = row
+        if max_age is not None and time.time() - fetched_at < max_age:
+            return detected_status
+        return None
+
+    def validators(self, url: str) -> Tuple[Dict[str, str], Optional[str]]:
+        """Return conditional request headers and the status they revalidate."""
+        row = self._row(url)
+        if row is None:
+            return {}, None
+        etag, last_modified, _, detected_status, _ = row
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers, detected_status if headers else None
+
+    def store(
+        self,
+        url: str,
+        response_headers: Any,
+        detected_status: str,
+        previous: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Record ``detected_status`` with the validators of ``response_headers``.
+
+        ``previous`` holds the conditional headers that were sent; a 304 may omit
+        the validators, in which case the ones already stored are kept.
+        """
+        previous = previous or {}
+        cache_control = (response_headers.get("Cache-Control") or "").lower()
+        if "no-store" in cache_control:
+            return
+        max_age_match = MAX_AGE_RE.search(cache_control)
+        max_age = float(max_age_match.group(1)) if max_age_match and "no-cache" not in cache_control else None
+        etag = response_headers.get("ETag") or previous.get("If-None-Match")
+        last_modified = response_headers.get("Last-Modified") or previous.get("If-Modified-Since")
+        if not (etag or last_modified or max_age):
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO listings VALUES (?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, max_age, detected_status, time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def append_checked(buffer: bytearray, chunk: bytes, url: str) -> None:
+    """Append ``chunk`` to ``buffer``, raising ``ChallengeDetected`` as soon as a marker shows up."""
+    start = max(len(buffer) - CHALLENGE_OVERLAP, 0)
+    buffer += chunk
+    window = buffer[start:].lower()
+    if any(marker in window for marker in CHALLENGE_MARKERS_BYTES):
+        raise ChallengeDetected(f"Bot challenge detected for {url}")
+
+
+def raise_for_listing_status(status_code: int, url: str) -> None:
+    if status_code in THROTTLE_STATUSES:
+        raise ChallengeDetected(f"Throttled with status {status_code} for {url}")
+    if status_code != 200:
+        raise HTTPErrorBase(f"Unexpected status {status_code} for {url}")
+
+
+def check_listing_response(response: Any, url: str) -> str:
+    """Read the body of a ``stream=True`` response, raising on errors and bot challenges.
+
+    Challenge pages announce themselves in the first few KB, so the download
+    is abandoned at the first marker instead of fetching the whole page.
+    """
+    try:
+        raise_for_listing_status(response.status_code, url)
+        buffer = bytearray()
+        for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+            append_checked(buffer, chunk, url)
+        return buffer.decode(response.encoding or "utf-8", errors="ignore")
+    finally:
+        response.close()
+
+
 def fetch_listing_html(session: Any, url: str, timeout: float = 30.0) -> str:
     LOGGER.debug("Fetching %s", url)
-    response = session.get(url, timeout=timeout)
-    if response.status_code != 200:
-        raise HTTPErrorBase(f"Unexpected status {response.status_code} for {url}")
-    text = response.text
-    lowered = text.lower()
-    if any(marker in lowered for marker in CHALLENGE_MARKERS_LOWER):
-        raise ChallengeDetected(f"Bot challenge detected for {url}")
-    return text
+    return check_listing_response(session.get(url, timeout=timeout, stream=True), url)
+
+
+def fetch_availability(session: Any, url: str, cache: Optional[ListingCache] = None, timeout: float = 30.0) -> str:
+    """Fetch ``url`` and detect its availability, revalidating through ``cache`` when given."""
+    if cache is None:
+        return detect_availability(fetch_listing_html(session, url, timeout=timeout))
+
+    conditional_headers, cached_status = cache.validators(url)
+    LOGGER.debug("Fetching %s (conditional: %s)", url, bool(conditional_headers))
+    response = session.get(url, timeout=timeout, headers=conditional_headers, stream=True)
+    if response.status_code == 304 and cached_status is not None:
+        LOGGER.debug("Not modified since last run: %s", url)
+        response.close()
+        cache.store(url, response.headers, cached_status, previous=conditional_headers)
+        return cached_status
+    availability = detect_availability(check_listing_response(response, url))
+    cache.store(url, response.headers, availability)
+    return availability
+
+
+async def fetch_availability_async(client: Any, url: str, cache: Optional[ListingCache] = None, timeout: float = 30.0) -> str:
+    """Async counterpart of :func:`fetch_availability` for an ``httpx.AsyncClient``.
+
+    HTML parsing runs in a worker thread so it never stalls other in-flight fetches.
+    """
+    conditional_headers, cached_status = cache.validators(url) if cache is not None else ({}, None)
+    LOGGER.debug("Fetching %s (conditional: %s)", url, bool(conditional_headers))
+    async with client.stream("GET", url, timeout=timeout, headers=conditional_headers) as response:
+        if response.status_code == 304 and cached_status is not None:
+            LOGGER.debug("Not modified since last run: %s", url)
+            cache.store(url, response.headers, cached_status, previous=conditional_headers)
+            return cached_status
+        raise_for_listing_status(response.status_code, url)
+        buffer = bytearray()
+        async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+            append_checked(buffer, chunk, url)
+        html = buffer.decode(response.encoding or "utf-8", errors="ignore")
+    availability = await asyncio.to_thread(detect_availability, html)
+    if cache is not None:
+        cache.store(url, response.headers, availability)
+    return availability
 
 
 def parse_availability_from_json(data: Dict[str, object]) -> Optional[str]:
@@ -374,14 +745,81 @@ def parse_availability_from_json(data: Dict[str, object]) -> Optional[str]:
     return None
 
 
-def detect_availability(html: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
+# Elements whose contents never count as visible page text
+NON_TEXT_TAGS = ("script", "style", "noscript", "template")
+
+if etree is not None:
+    LD_JSON_XPATH = etree.XPath('//script[@type="application/ld+json"]/text()')
+
+
+class ListingDocument:
+    """Parsed listing page, backed by selectolax, lxml or BeautifulSoup, whichever is installed first."""
+
+    def __init__(self, html: str) -> None:
+        self._tree = None
+        self._root = None
+        self._soup = None
+        if HTMLParser is not None:
+            self._tree = HTMLParser(html)
+            return
+        if lxml_html is not None:
+            try:
+                self._root = lxml_html.fromstring(html)
+                return
+            except (etree.ParserError, ValueError):  # empty page or an XML encoding declaration
+                pass
+        self._soup = BeautifulSoup(html, "html.parser")
+
+    def ld_json_blocks(self) -> List[Optional[str]]:
+        if self._tree is not None:
+            return [node.text(deep=True) for node in self._tree.css('script[type="application/ld+json"]')]
+        if self._root is not None:
+            return [str(raw) for raw in LD_JSON_XPATH(self._root)]
+        return [script.string for script in self._soup.find_all("script", attrs={"type": "application/ld+json"})]
+
+    def visible_text(self) -> str:
+        """Return the lower-cased document text, excluding script and style contents."""
+        if self._tree is not None:
+            self._tree.strip_tags(list(NON_TEXT_TAGS))
+            root = self._tree.root
+            return root.text(separator=" ", strip=True).lower() if root is not None else ""
+        if self._root is not None:
+            etree.strip_elements(self._root, *NON_TEXT_TAGS, with_tail=False)
+            etree.strip_tags(self._root, etree.Comment)
+            return " ".join(part.strip() for part in self._root.itertext() if part.strip()).lower()
+        return self._soup.get_text(" ", strip=True).lower()
+
+
+def scan_schema_availability(html: str) -> Optional[str]:
+    """Return the status when the page mentions exactly one schema.org availability value.
+
+    Most listings resolve here without building a DOM; pages mentioning both
+    values (e.g. per-variant offers) fall through to the structured parse.
+    """
+    found = {status for token, status in SCHEMA_AVAILABILITY_TOKENS if token in html}
+    if len(found) == 1:
+        return found.pop()
+    return None
 
-    # Prefer structured data blocks.
-    for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
+
+def detect_availability(html: Union[str, bytes]) -> str:
+    if isinstance(html, bytes):
+        html = html.decode("utf-8", errors="ignore")
+
+    quick = scan_schema_availability(html)
+    if quick:
+        return quick
+
+    document = ListingDocument(html)
+
+    # Prefer structured data blocks. Every key parse_availability_from_json
+    # reads contains "availability", so other blocks are skipped unparsed.
+    for raw in document.ld_json_blocks():
+        if not raw or "availability" not in raw:
+            continue
         try:
-            payload = json.loads(script.string)
-        except (TypeError, json.JSONDecodeError):
+            payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (TypeError, json.JSONDecodeError):  # orjson.JSONDecodeError subclasses the latter
             continue
         if isinstance(payload, dict):
             availability = parse_availability_from_json(payload)
@@ -395,33 +833,215 @@ def detect_availability(html: str) -> str:
                         return availability
 
     # Fallback: look for explicit text markers.
-    normalized = soup.get_text(" ", strip=True).lower()
+    normalized = document.visible_text()
     if "out of stock" in normalized:
         return "OUT_OF_STOCK"
     if "in stock" in normalized or "last one" in normalized:
         return "IN_STOCK"
 
-    # Fallback: search within data attributes.
+    # Fallback: search within data attributes. Substring probes in priority
+    # order stop at the first hit; each is a fast C scan, far quicker than one
+    # pass of a regex alternation over the same page.
     if "\"availability\":" in html:
-        for token, status in AVAILABILITY_STRINGS.items():
-            if token in html:
-                return status
+        return next((status for token, status in AVAILABILITY_STRINGS.items() if token in html), "UNKNOWN")
 
     return "UNKNOWN"
 
 
+RESULT_COLUMNS: Tuple[str, ...] = (
+    "row_index",
+    "excel_row",
+    "sheet_sr_no",
+    "stock_name",
+    "variation",
+    "size",
+    "dimensions",
+    "sheet_stock_status",
+    "detected_status",
+    "item_number",
+    "variation_id",
+    "listing_url",
+    "source_url",
+    "error",
+)
+
+
+def result_row(record: VariantRecord, availability: str, error_message: Optional[str]) -> Dict[str, Any]:
+    return dict(zip(RESULT_COLUMNS, (
+        record.row_index,
+        record.excel_row,
+        record.sr_no,
+        record.stock_name,
+        record.variation,
+        record.size,
+        record.dimensions,
+        record.sheet_stock_status,
+        availability,
+        record.item_number or record.base_item_id,
+        record.variation_id,
+        record.listing_url,
+        record.source_url,
+        error_message,
+    )))
+
+
+class ResultCheckpoint:
+    """Append-only CSV of result rows, written as soon as each listing is checked.
+
+    Rerunning against the same file resumes the job: listings that already
+    resolved to a status there are not fetched again, while BLOCKED and
+    ERROR listings are retried.
+    """
+
+    RETRY_STATUSES = frozenset({"BLOCKED", "ERROR"})
+
+    def __init__(self, path: Path) -> None:
+        self.completed: Dict[str, Tuple[str, Optional[str]]] = {}
+        resuming = path.exists() and path.stat().st_size > 0
+        if resuming:
+            with path.open(newline="", encoding="utf-8") as handle:
+                for row in csv.DictReader(handle):
+                    status = row.get("detected_status")
+                    if status and status not in self.RETRY_STATUSES:
+                        self.completed[row["listing_url"]] = (status, row.get("error") or None)
+            LOGGER.info("Resuming from %s: %d listings already checked", path, len(self.completed))
+        self._lock = threading.Lock()
+        self._handle = path.open("a", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._handle, fieldnames=RESULT_COLUMNS)
+        if not resuming:
+            self._writer.writeheader()
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._writer.writerows(rows)
+            self._handle.flush()
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+def check_record_requests(
+    record: VariantRecord,
+    session: Any,
+    delay: float,
+    max_retries: int,
+    limiter: RateLimiter,
+    index: int,
+    total: int,
+    cache: Optional[ListingCache] = None,
+) -> Tuple[str, Optional[str]]:
+    """Return the detected status of ``record``'s listing and the last error, if any."""
+    LOGGER.info(
+        "[%s/%s] Checking item %s (variant %s)",
+        index,
+        total,
+        record.item_number or record.base_item_id,
+        record.variation or record.size or record.variation_id,
+    )
+
+    attempts = 0
+    availability = "BLOCKED"
+    error_message = None
+    cached_status = cache.fresh_status(record.listing_url) if cache is not None else None
+    while cached_status is None and attempts <= max_retries:
+        attempts += 1
+        try:
+            limiter.wait(record.listing_url)
+            availability = fetch_availability(session, record.listing_url, cache)
+            limiter.record(record.listing_url, blocked=False)
+            error_message = None
+            break
+        except ChallengeDetected as exc:
+            error_message = str(exc)
+            LOGGER.warning("Challenge detected for %s", record.listing_url)
+            availability = "BLOCKED"
+            # Pauses every worker hitting this host, not just this one
+            limiter.record(record.listing_url, blocked=True)
+            limiter.back_off(record.listing_url, backoff_delay(delay, attempts))
+        except Exception as exc:  # pylint: disable=broad-except
+            error_message = str(exc)
+            LOGGER.exception("Failed to process %s", record.listing_url)
+            availability = "ERROR"
+            if attempts <= max_retries:
+                time.sleep(backoff_delay(delay, attempts - 1))
+    else:
+        if cached_status is not None:
+            LOGGER.debug("Using cached status for %s", record.listing_url)
+            availability = cached_status
+        else:
+            LOGGER.error(
+                "Max retries exceeded for %s", record.listing_url
+            )
+
+    return availability, error_message
+
+
+def group_by_listing(
+    records: List[VariantRecord], checkpoint: Optional[ResultCheckpoint] = None
+) -> Tuple[Dict[str, List[VariantRecord]], Dict[str, Tuple[str, Optional[str]]]]:
+    """Split rows into listings still to fetch and outcomes already known.
+
+    Availability is read off the listing page rather than the variant, so
+    every row of a listing shares one fetch. Returns the rows of each pending
+    listing keyed by URL, in sheet order, and the outcomes resumed from
+    ``checkpoint``.
+    """
+    pending: Dict[str, List[VariantRecord]] = {}
+    resumed: Dict[str, Tuple[str, Optional[str]]] = {}
+    for record in records:
+        if checkpoint is not None and record.listing_url in checkpoint.completed:
+            resumed[record.listing_url] = checkpoint.completed[record.listing_url]
+        else:
+            pending.setdefault(record.listing_url, []).append(record)
+    LOGGER.info("Checking %d listings for %d rows (%d resumed)", len(pending), len(records), len(resumed))
+    return pending, resumed
+
+
 def process_variants_requests(
     records: List[VariantRecord],
     session: Any,
     delay: float,
     max_retries: int,
+    workers: int = 1,
+    cache: Optional[ListingCache] = None,
+    checkpoint: Optional[ResultCheckpoint] = None,
 ) -> pd.DataFrame:
-    results = []
-    for index, record in enumerate(records, start=1):
+    workers = max(1, workers)
+    # While a host is challenging, each worker waits ``delay`` between its own requests on average
+    limiter = RateLimiter(delay / workers)
+    pending, outcomes = group_by_listing(records, checkpoint)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                check_record_requests, rows[0], session, delay, max_retries, limiter, index, len(pending), cache
+            ): url
+            for index, (url, rows) in enumerate(pending.items(), start=1)
+        }
+        for future in as_completed(futures):
+            url = futures[future]
+            outcomes[url] = future.result()
+            if checkpoint is not None:
+                checkpoint.write([result_row(row, *outcomes[url]) for row in pending[url]])
+
+    return pd.DataFrame([result_row(record, *outcomes[record.listing_url]) for record in records])
+
+
+async def check_record_async(
+    record: VariantRecord,
+    client: Any,
+    semaphore: asyncio.Semaphore,
+    delay: float,
+    max_retries: int,
+    limiter: RateLimiter,
+    index: int,
+    total: int,
+    cache: Optional[ListingCache] = None,
+) -> Tuple[str, Optional[str]]:
+    async with semaphore:
         LOGGER.info(
             "[%s/%s] Checking item %s (variant %s)",
             index,
-            len(records),
+            total,
             record.item_number or record.base_item_id,
             record.variation or record.size or record.variation_id,
         )
@@ -429,82 +1049,142 @@ def process_variants_requests(
         attempts = 0
         availability = "BLOCKED"
         error_message = None
-        while attempts <= max_retries:
+        cached_status = cache.fresh_status(record.listing_url) if cache is not None else None
+        while cached_status is None and attempts <= max_retries:
             attempts += 1
             try:
-                html = fetch_listing_html(session, record.listing_url)
-                availability = detect_availability(html)
+                await asyncio.sleep(limiter.reserve(record.listing_url))
+                availability = await fetch_availability_async(client, record.listing_url, cache)
+                limiter.record(record.listing_url, blocked=False)
                 error_message = None
                 break
             except ChallengeDetected as exc:
                 error_message = str(exc)
                 LOGGER.warning("Challenge detected for %s", record.listing_url)
                 availability = "BLOCKED"
-                time.sleep(delay * 2)
+                limiter.record(record.listing_url, blocked=True)
+                limiter.back_off(record.listing_url, backoff_delay(delay, attempts))
             except Exception as exc:  # pylint: disable=broad-except
                 error_message = str(exc)
                 LOGGER.exception("Failed to process %s", record.listing_url)
                 availability = "ERROR"
-                time.sleep(delay)
+                if attempts <= max_retries:
+                    await asyncio.sleep(backoff_delay(delay, attempts - 1))
         else:
-            LOGGER.error(
-                "Max retries exceeded for %s", record.listing_url
+            if cached_status is not None:
+                LOGGER.debug("Using cached status for %s", record.listing_url)
+                availability = cached_status
+            else:
+                LOGGER.error("Max retries exceeded for %s", record.listing_url)
+
+    return availability, error_message
+
+
+async def fetch_all(
+    records: List[VariantRecord],
+    headers: Dict[str, str],
+    cookie_header: Optional[str],
+    delay: float,
+    max_retries: int,
+    concurrency: int = 1,
+    cache: Optional[ListingCache] = None,
+    checkpoint: Optional[ResultCheckpoint] = None,
+) -> Dict[str, Tuple[str, Optional[str]]]:
+    """Check each distinct listing on one event loop with up to ``concurrency`` requests in flight.
+
+    Returns the detected status and last error keyed by listing URL.
+    """
+    concurrency = max(1, concurrency)
+    limiter = RateLimiter(delay / concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(
+        http2=h2 is not None,
+        limits=limits,
+        headers=headers,
+        cookies=parse_cookie_header(cookie_header),
+        follow_redirects=True,
+    ) as client:
+        pending, outcomes = group_by_listing(records, checkpoint)
+
+        async def check_listing(index: int, url: str, rows: List[VariantRecord]) -> None:
+            outcomes[url] = await check_record_async(
+                rows[0], client, semaphore, delay, max_retries, limiter, index, len(pending), cache
             )
+            if checkpoint is not None:
+                checkpoint.write([result_row(row, *outcomes[url]) for row in rows])
 
-        results.append(
-            {
-                "row_index": record.row_index,
-                "excel_row": record.excel_row,
-                "sheet_sr_no": record.sr_no,
-                "stock_name": record.stock_name,
-                "variation": record.variation,
-                "size": record.size,
-                "dimensions": record.dimensions,
-                "sheet_stock_status": record.sheet_stock_status,
-                "detected_status": availability,
-                "item_number": record.item_number or record.base_item_id,
-                "variation_id": record.variation_id,
-                "listing_url": record.listing_url,
-                "source_url": record.source_url,
-                "error": error_message,
-            }
+        await asyncio.gather(
+            *(check_listing(index, url, rows) for index, (url, rows) in enumerate(pending.items(), start=1))
         )
+    return outcomes
+
+
+def process_variants_async(
+    records: List[VariantRecord],
+    cookie_header: Optional[str],
+    delay: float,
+    max_retries: int,
+    workers: int = 1,
+    cache: Optional[ListingCache] = None,
+    checkpoint: Optional[ResultCheckpoint] = None,
+) -> pd.DataFrame:
+    if httpx is None:
+        raise RuntimeError("httpx is not installed. Install it via 'pip install httpx[http2]'.")
+    outcomes = asyncio.run(
+        fetch_all(records, DEFAULT_HEADERS.copy(), cookie_header, delay, max_retries, workers, cache, checkpoint)
+    )
+    return pd.DataFrame([result_row(record, *outcomes[record.listing_url]) for record in records])
 
-        if index < len(records):
-            time.sleep(delay)
 
-    return pd.DataFrame(results)
+# Option matching runs for every option of every group on every row, over a
+# small set of distinct labels, so the text helpers below are memoised
+WHITESPACE_RE = re.compile(r"\s+")
+SIZE_UNIT_RE = re.compile(r"cm|mm", re.IGNORECASE)
 
 
+@lru_cache(maxsize=2048)
 def normalize_label(text: str) -> str:
-    return " ".join(text.lower().split())
+    return WHITESPACE_RE.sub(" ", text).strip().lower()
+
 
+@lru_cache(maxsize=2048)
+def has_dimensions(text: str) -> bool:
+    """Return True for texts like "60 x 110" that contain an ``x`` and a digit."""
+    return "x" in text.lower() and any(c.isdigit() for c in text)
 
+
+# "GelBack-Pink" (prefix-colour) forms are checked before " - " so that
+# "GelBack-Pink - Gel Back 59" still resolves to the part after the prefix
+COLOUR_DASH_PREFIXES: Tuple[str, ...] = ("gelback-", "gel back-")
+# "GelBack Pink" (prefix space colour) forms
+COLOUR_SPACE_PREFIXES: Tuple[str, ...] = ("gelback ", "gel back ")
+
+
+@lru_cache(maxsize=2048)
 def extract_base_colour(colour_text: str) -> str:
     """Extract base colour name by removing seller-specific suffixes and prefixes."""
-    text = colour_text.strip()
-    
+    # Lowercase once; every branch returns a lowercased slice of this view
+    low = colour_text.strip().lower()
+
     # Handle "GelBack-Pink" format (prefix-colour) -> extract "pink"
-    if text.lower().startswith('gelback-') or text.lower().startswith('gel back-'):
-        # Remove the prefix and return the colour part
-        parts = text.split('-', 1)
-        if len(parts) == 2:
-            return parts[1].strip().lower()
-    
+    for prefix in COLOUR_DASH_PREFIXES:
+        if low.startswith(prefix):
+            return low[len(prefix):].strip()
+
     # Handle "Pink - Gel Back 59" format (colour - suffix) -> extract "pink"
-    if ' - ' in text:
-        base = text.split(' - ')[0].strip()
-        return base.lower()
-    
+    if " - " in low:
+        return low.split(" - ", 1)[0].strip()
+
     # Handle "GelBack Pink" format (prefix space colour) -> extract "pink"
-    if text.lower().startswith('gelback ') or text.lower().startswith('gel back '):
-        parts = text.split(' ', 1)
-        if len(parts) == 2:
-            return parts[1].strip().lower()
-    
-    return text.lower()
+    for prefix in COLOUR_SPACE_PREFIXES:
+        if low.startswith(prefix):
+            return low[len(prefix):].strip()
+
+    return low
 
 
+@lru_cache(maxsize=2048)
 def extract_base_size(size_text: str) -> str:
     """Extract base size by removing imperial measurements and extra text."""
     # Remove imperial measurements in parentheses like "(1 ft 4 in x 2 ft)"
@@ -541,9 +1221,7 @@ def option_matches(option_text: str, target: str) -> bool:
     
     # For size matching: strip imperial measurements, units, and compare
     # Check if this looks like a size (contains "cm", "mm", "m", or "x" followed by digits)
-    if ('cm' in option_text.lower() or 'mm' in option_text.lower() or 
-        ('x' in option_text.lower() and any(c.isdigit() for c in option_text)) or
-        ('x' in target.lower() and any(c.isdigit() for c in target))):
+    if SIZE_UNIT_RE.search(option_text) or has_dimensions(option_text) or has_dimensions(target):
         option_base = extract_base_size(option_text)
         target_base = extract_base_size(target)
         # Normalize spaces around 'x' for comparison (e.g., "60x110" vs "60 x 110")
@@ -574,56 +1252,115 @@ def interpret_option_state(option_text: str, class_attr: Optional[str], aria_dis
     return disabled, reason
 
 
-def collect_variant_groups(page) -> List[Dict[str, Any]]:
-    groups: List[Dict[str, Any]] = []
+# Group selectors in the order groups are collected: primary SKU widgets,
+# alternative button based selectors (data-testid), then select dropdowns
+# (older layout)
+VARIANT_GROUP_SELECTORS = {
+    "vim": "div.vim.x-sku",
+    "msku": "[data-testid='x-msku__group']",
+    "select": "select[name^='variation'], select#msku-sel-1",
+}
 
-    # Primary SKU widgets
-    containers = page.locator("div.vim.x-sku")
-    container_count = containers.count()
-    LOGGER.debug("Found %d variant containers (div.vim.x-sku)", container_count)
-    for idx in range(containers.count()):
-        container = containers.nth(idx)
-        try:
-            label = container.locator(".btn__label").inner_text(timeout=1000).strip()
-        except PlaywrightTimeoutError:
-            label = None
-        if not label:
-            continue
-        LOGGER.debug("Found group '%s' via div.vim.x-sku", label.rstrip(":"))
-        groups.append({
-            "label": label.rstrip(":"),
-            "locator": container,
-            "type": "vim",
-        })
-
-    # Alternative button based selectors (data-testid)
-    alt_buttons = page.locator("[data-testid='x-msku__group']")
-    for idx in range(alt_buttons.count()):
-        group = alt_buttons.nth(idx)
+VARIANT_GROUPS_SELECTOR = ", ".join(VARIANT_GROUP_SELECTORS.values())
+
+# Reads every group's label in one browser round-trip
+VARIANT_GROUPS_JS = """
+selectors => Object.entries(selectors).flatMap(([type, selector]) =>
+  [...document.querySelectorAll(selector)].map((el, index) => {
+    let label;
+    if (type === 'vim') {
+      label = el.querySelector('.btn__label')?.innerText;
+    } else if (type === 'msku') {
+      label = el.querySelector("[data-testid='x-msku__group-title']")?.innerText;
+    } else {
+      label = el.closest('div')?.querySelector('label, span')?.innerText || el.getAttribute('name');
+    }
+    return {type, index, label: (label || '').trim()};
+  })
+)
+"""
+
+# Reads the text and state attributes of every option in one round-trip
+OPTION_STATE_JS = """
+els => els.map(e => ({
+  text: e.innerText.trim(),
+  sku: e.getAttribute('data-sku-value-name'),
+  cls: e.getAttribute('class'),
+  aria: e.getAttribute('aria-disabled'),
+  value: e.getAttribute('value'),
+  disabled: e.hasAttribute('disabled'),
+}))
+"""
+
+# Injected into every document: counts fetch/XHR requests in flight and stamps
+# the last time one started or finished, so waits can end as soon as the
+# variant AJAX settles instead of after a fixed sleep
+INFLIGHT_COUNTER_JS = """
+(() => {
+  if (window.__pwInflight !== undefined) return;
+  window.__pwInflight = 0;
+  window.__pwLastActivity = Date.now();
+  const begin = () => { window.__pwInflight += 1; window.__pwLastActivity = Date.now(); };
+  const end = () => { window.__pwInflight = Math.max(0, window.__pwInflight - 1); window.__pwLastActivity = Date.now(); };
+  const fetch = window.fetch;
+  if (fetch) {
+    window.fetch = function (...args) {
+      begin();
+      try {
+        return fetch.apply(this, args).finally(end);
+      } catch (err) {
+        end();
+        throw err;
+      }
+    };
+  }
+  const send = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function (...args) {
+    begin();
+    this.addEventListener('loadend', end, {once: true});
+    try {
+      return send.apply(this, args);
+    } catch (err) {
+      end();
+      throw err;
+    }
+  };
+})();
+"""
+
+NETWORK_QUIET_JS = """
+idleMs => (window.__pwInflight || 0) === 0 && Date.now() - (window.__pwLastActivity || 0) >= idleMs
+"""
+
+DEFAULT_IDLE_MS = 400
+
+
+async def wait_for_network_quiet(page, idle_ms: int = DEFAULT_IDLE_MS, timeout: float = 3000) -> None:
+    """Wait until no fetch/XHR has been in flight on ``page`` for ``idle_ms``.
+
+    eBay keeps analytics connections open, so the counters can fail to settle;
+    Playwright's networkidle state is then used as a short backstop.
+    """
+    try:
+        await page.wait_for_function(NETWORK_QUIET_JS, arg=idle_ms, polling=100, timeout=timeout)
+    except PlaywrightTimeoutError:
+        LOGGER.debug("Requests still in flight after %sms, falling back to networkidle", timeout)
         try:
-            label = group.locator("[data-testid='x-msku__group-title']").inner_text(timeout=1000).strip()
+            await page.wait_for_load_state("networkidle", timeout=2000)
         except PlaywrightTimeoutError:
-            label = None
-        if not label:
-            continue
-        groups.append({
-            "label": label.rstrip(":"),
-            "locator": group,
-            "type": "msku",
-        })
-
-    # Fallback to select dropdowns (older layout)
-    legacy_selects = page.locator("select[name^='variation'], select#msku-sel-1")
-    for idx in range(legacy_selects.count()):
-        select_el = legacy_selects.nth(idx)
-        label = select_el.evaluate("el => el.closest('div')?.querySelector('label, span')?.innerText || el.getAttribute('name')")
+            pass
+
+
+async def scan_variant_groups(page) -> List[Dict[str, Any]]:
+    """Return the label, type and selector index of each variant group on ``page``."""
+    groups: List[Dict[str, Any]] = []
+
+    for found in await page.evaluate(VARIANT_GROUPS_JS, VARIANT_GROUP_SELECTORS):
+        label = found["label"].rstrip(":")
         if not label:
             continue
-        groups.append({
-            "label": str(label).strip().rstrip(":"),
-            "locator": select_el,
-            "type": "select",
-        })
+        LOGGER.debug("Found group '%s' via %s", label, VARIANT_GROUP_SELECTORS[found["type"]])
+        groups.append({"label": label, "type": found["type"], "index": found["index"]})
 
     LOGGER.debug("Total variant groups collected: %d", len(groups))
     for idx, grp in enumerate(groups):
@@ -632,6 +1369,18 @@ def collect_variant_groups(page) -> List[Dict[str, Any]]:
     return groups
 
 
+def bind_variant_groups(page, groups: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # Only the groups later clicked need a locator, and locators are lazy
+    return [
+        {**group, "locator": page.locator(VARIANT_GROUP_SELECTORS[group["type"]]).nth(group["index"])}
+        for group in groups
+    ]
+
+
+# Scanned variant groups and the group index of each dimension per listing
+# URL, so later rows of the same listing skip the DOM scan
+VARIANT_GROUP_CACHE: Dict[str, Tuple[List[Dict[str, Any]], Dict[str, Optional[int]]]] = {}
+
 GROUP_KEYWORDS = {
     "size": ["size", "length", "dimensions"],
     "variation": ["colour", "color", "design", "style", "pattern"],
@@ -653,7 +1402,9 @@ def find_group_for_dimension(groups: List[Dict[str, Any]], dimension: str, used_
     return None
 
 
-def select_option_from_group(page, group: Dict[str, Any], target_value: str) -> Tuple[bool, Optional[str]]:
+async def select_option_from_group(
+    page, group: Dict[str, Any], target_value: str, idle_ms: int = DEFAULT_IDLE_MS
+) -> Tuple[bool, Optional[str]]:
     locator = group["locator"]
     group_type = group.get("type", "vim")
     group_label = group.get("label", "unknown")
@@ -662,22 +1413,18 @@ def select_option_from_group(page, group: Dict[str, Any], target_value: str) ->
 
     if group_type == "select":
         try:
-            locator.scroll_into_view_if_needed(timeout=2000)
+            await locator.scroll_into_view_if_needed(timeout=2000)
         except PlaywrightTimeoutError:
             pass
         select = locator
-        options = select.locator("option")
-        count = options.count()
-        for idx in range(count):
-            option = options.nth(idx)
-            text = option.inner_text().strip()
+        for option in await select.locator("option").evaluate_all(OPTION_STATE_JS):
+            text = option["text"]
             if option_matches(text, target_value):
-                disabled_attr = option.get_attribute("disabled")
-                if disabled_attr is not None:
+                if option["disabled"]:
                     return False, "Option disabled"
-                option_value = option.get_attribute("value") or text
-                select.select_option(option_value)
-                page.wait_for_timeout(400)
+                option_value = option["value"] or text
+                await select.select_option(option_value)
+                await wait_for_network_quiet(page, idle_ms)
                 return True, None
         return False, f"Variant value '{target_value}' not found"
 
@@ -688,340 +1435,489 @@ def select_option_from_group(page, group: Dict[str, Any], target_value: str) ->
     ]
     button = None
     for candidate in button_locators:
-        if candidate.count():
+        if await candidate.count():
             button = candidate.first
             break
     if button is None:
         return False, "Variant selector button missing"
 
     try:
-        button.scroll_into_view_if_needed(timeout=2000)
+        await button.scroll_into_view_if_needed(timeout=2000)
     except PlaywrightTimeoutError:
         pass
-    button.click()
-    page.wait_for_timeout(300)
+    await button.click()
+    await page.wait_for_timeout(300)
 
     options_container = locator
     options_in_button = locator.locator("div.listbox__options")
-    if options_in_button.count() > 0:
+    if await options_in_button.count() > 0:
         try:
-            options_in_button.first.wait_for(state="visible", timeout=2000)
+            await options_in_button.first.wait_for(state="visible", timeout=2000)
             options_container = options_in_button.first
         except PlaywrightTimeoutError:
             pass
 
     if options_container == locator:
-        aria_controls = button.get_attribute("aria-controls")
+        aria_controls = await button.get_attribute("aria-controls")
         if aria_controls:
             targeted = page.locator(f"#{aria_controls}")
             try:
-                targeted.wait_for(state="visible", timeout=2000)
-                if targeted.count():
+                await targeted.wait_for(state="visible", timeout=2000)
+                if await targeted.count():
                     options_container = targeted
             except PlaywrightTimeoutError:
                 pass
 
     options = options_container.locator("div.listbox__option")
-    if options.count() == 0:
+    snapshot = await options.evaluate_all(OPTION_STATE_JS)
+    if not snapshot:
         options = options_container.locator("li[role='option']")
-    
-    chosen_option = None
-    chosen_text = ""
-    
-    for idx in range(options.count()):
-        option = options.nth(idx)
-        data_sku_value = option.get_attribute("data-sku-value-name")
-        if data_sku_value and option_matches(data_sku_value, target_value):
-            chosen_option = option
-            chosen_text = option.inner_text().strip()
-            LOGGER.debug("Matched option via data-sku-value-name: %s", data_sku_value)
-            break
-    
-    if chosen_option is None:
-        for idx in range(options.count()):
-            option = options.nth(idx)
-            text = option.inner_text().strip()
-            if option_matches(text, target_value):
-                chosen_option = option
-                chosen_text = text
-                LOGGER.debug("Matched option via text: %s", text)
-                break
-    if chosen_option is None:
-        button.press("Escape")
+        snapshot = await options.evaluate_all(OPTION_STATE_JS)
+
+    # Match in Python against one snapshot of the options; only the chosen
+    # option is touched through a locator again
+    chosen_idx = next(
+        (idx for idx, option in enumerate(snapshot) if option["sku"] and option_matches(option["sku"], target_value)),
+        None,
+    )
+    if chosen_idx is not None:
+        LOGGER.debug("Matched option via data-sku-value-name: %s", snapshot[chosen_idx]["sku"])
+    else:
+        chosen_idx = next(
+            (idx for idx, option in enumerate(snapshot) if option_matches(option["text"], target_value)),
+            None,
+        )
+        if chosen_idx is not None:
+            LOGGER.debug("Matched option via text: %s", snapshot[chosen_idx]["text"])
+    if chosen_idx is None:
+        await button.press("Escape")
         return False, f"Variant value '{target_value}' not found"
 
-    class_attr = chosen_option.get_attribute("class")
-    aria_disabled = chosen_option.get_attribute("aria-disabled")
+    chosen_option = options.nth(chosen_idx)
+    chosen_text = snapshot[chosen_idx]["text"]
+    class_attr = snapshot[chosen_idx]["cls"]
+    aria_disabled = snapshot[chosen_idx]["aria"]
     LOGGER.debug("Option state check - text: %s, class: %s, aria-disabled: %s", chosen_text, class_attr, aria_disabled)
     disabled, reason = interpret_option_state(chosen_text, class_attr, aria_disabled)
     if disabled:
         LOGGER.info("Option is disabled: %s", reason)
-        button.press("Escape")
+        await button.press("Escape")
         return False, reason or "Option disabled"
 
     # Scroll option into view within dropdown and wait for it to be visible
     try:
-        chosen_option.scroll_into_view_if_needed(timeout=3000)
-        chosen_option.wait_for(state="visible", timeout=3000)
+        await chosen_option.scroll_into_view_if_needed(timeout=3000)
+        await chosen_option.wait_for(state="visible", timeout=3000)
     except PlaywrightTimeoutError:
         LOGGER.warning("Option not visible after scroll, attempting click anyway")
     
     try:
-        chosen_option.click(timeout=10000)
+        await chosen_option.click(timeout=10000)
     except PlaywrightTimeoutError:
-        button.press("Escape")
+        await button.press("Escape")
         return False, f"Timeout clicking option '{target_value}' - element not interactable"
     
-    page.wait_for_timeout(800)
+    await wait_for_network_quiet(page, idle_ms)
     return True, None
 
 
-def evaluate_availability(page) -> Tuple[str, Optional[str]]:
-    script = """
-    () => {
-      const selectors = [
-        '[data-testid="x-msku__availability-message"]',
-        '#x-msku__availability-message',
-        '#qtySubTxt',
-        '[data-testid="availability-text"]',
-        '[data-testid="availability-messaging"]'
-      ];
-      for (const sel of selectors) {
-        const el = document.querySelector(sel);
-        if (el && el.textContent) {
-          const text = el.textContent.trim();
-          if (text) return text;
-        }
-      }
-      const button = document.querySelector('button[data-testid="art-atc-button"]') || document.querySelector('#atcRedesignId_btn');
-      if (button) {
-        const disabled = button.getAttribute('aria-disabled') === 'true' || button.hasAttribute('disabled');
-        return disabled ? 'Add to basket disabled' : 'Add to basket enabled';
-      }
-      return null;
+# Reads the availability message (or the add-to-basket state) and classifies
+# it in the page, returning [status, message]
+AVAILABILITY_JS = """
+() => {
+  const selectors = [
+    '[data-testid="x-msku__availability-message"]',
+    '#x-msku__availability-message',
+    '#qtySubTxt',
+    '[data-testid="availability-text"]',
+    '[data-testid="availability-messaging"]'
+  ];
+  let text = null;
+  for (const sel of selectors) {
+    const el = document.querySelector(sel);
+    if (el && el.textContent && el.textContent.trim()) {
+      text = el.textContent.trim();
+      break;
     }
-    """
+  }
+  if (text === null) {
+    const button = document.querySelector('button[data-testid="art-atc-button"]') || document.querySelector('#atcRedesignId_btn');
+    if (button) {
+      const disabled = button.getAttribute('aria-disabled') === 'true' || button.hasAttribute('disabled');
+      text = disabled ? 'Add to basket disabled' : 'Add to basket enabled';
+    }
+  }
+  const outOfStock = text !== null && /out of stock|unavailable|add to basket disabled/.test(text.toLowerCase());
+  return [outOfStock ? 'OUT_OF_STOCK' : 'IN_STOCK', text];
+}
+"""
+
+
+async def evaluate_availability(page) -> Tuple[str, Optional[str]]:
     try:
-        availability_text = page.evaluate(script)
+        availability, availability_text = await page.evaluate(AVAILABILITY_JS)
     except Exception as exc:
         LOGGER.warning("Failed to evaluate availability script, retrying after delay: %s", exc)
-        page.wait_for_timeout(1000)
+        await page.wait_for_timeout(1000)
         try:
-            availability_text = page.evaluate(script)
+            availability, availability_text = await page.evaluate(AVAILABILITY_JS)
         except Exception as retry_exc:
             LOGGER.error("Failed to evaluate availability after retry: %s", retry_exc)
             return "IN_STOCK", None
-    
-    if availability_text:
-        lowered = availability_text.lower()
-        if "out of stock" in lowered or "unavailable" in lowered:
-            return "OUT_OF_STOCK", availability_text
-        if "add to basket disabled" in lowered:
-            return "OUT_OF_STOCK", availability_text
-    return "IN_STOCK", availability_text
+    return availability, availability_text
 
 
-def detect_challenge(page) -> bool:
-    try:
-        main_text = page.inner_text("body", timeout=2000).lower()
-    except PlaywrightTimeoutError:
-        main_text = ""
-    if any(marker in main_text for marker in CHALLENGE_MARKERS_LOWER):
-        return True
+# Scans the body text for challenge markers inside the page, so the text
+# itself never has to be serialised back to Python
+CHALLENGE_SCAN_JS = """
+(body, markers) => {
+  const text = body.innerText.toLowerCase();
+  return markers.some(marker => text.includes(marker));
+}
+"""
+
+
+async def detect_challenge(page) -> bool:
+    # Cheapest signals first: the URL is local, the title one short round-trip
     if page.url and "splashui/challenge" in page.url:
         return True
-    return False
+    try:
+        title = (await page.title()).lower()
+    except Exception:  # pylint: disable=broad-except
+        title = ""
+    if any(marker in title for marker in CHALLENGE_MARKERS_LOWER):
+        return True
+    try:
+        return bool(await page.locator("body").evaluate(CHALLENGE_SCAN_JS, list(CHALLENGE_MARKERS_LOWER), timeout=2000))
+    except PlaywrightTimeoutError:
+        return False
 
 
-def process_variants_chromium(
+async def check_record_chromium(
+    page: Any,
+    record: VariantRecord,
+    delay: float,
+    max_retries: int,
+    index: int,
+    total: int,
+    idle_ms: int = DEFAULT_IDLE_MS,
+) -> Tuple[str, Optional[str]]:
+    LOGGER.info("[Chromium %s/%s] Checking item %s", index, total, record.item_number or record.base_item_id)
+    attempts = 0
+    availability = "BLOCKED"
+    error_message: Optional[str] = None
+    while attempts <= max_retries:
+        attempts += 1
+        try:
+            await page.goto(
+                record.listing_url,
+                wait_until="domcontentloaded",
+                timeout=45000,
+            )
+            await wait_for_network_quiet(page, idle_ms)
+            if await detect_challenge(page):
+                raise ChallengeDetected("Bot challenge page encountered")
+
+            cached = VARIANT_GROUP_CACHE.get(record.listing_url)
+            from_cache = cached is not None
+            if not (record.variation or record.size):
+                # Nothing to select, so the page's groups are never looked at
+                cached = ([], {dim: None for dim in GROUP_KEYWORDS})
+            elif from_cache and cached[0]:
+                # The group positions are known, but this load still has to
+                # render them before the cached locators can be used
+                await page.wait_for_selector(VARIANT_GROUPS_SELECTOR, state="attached", timeout=5000)
+            elif not from_cache:
+                # Returns as soon as a variant group exists; single-variant
+                # listings have none, so a miss is not an error
+                timed_out = False
+                try:
+                    await page.wait_for_selector(VARIANT_GROUPS_SELECTOR, state="attached", timeout=5000)
+                except PlaywrightTimeoutError:
+                    LOGGER.debug("No variant group rendered for %s", record.listing_url)
+                    timed_out = True
+                scanned = await scan_variant_groups(page)
+                cached = (scanned, {dim: find_group_for_dimension(scanned, dim, set()) for dim in GROUP_KEYWORDS})
+                # An empty scan is only kept once the full wait found no
+                # group, so later rows of a listing without variants skip it
+                if scanned or timed_out:
+                    VARIANT_GROUP_CACHE[record.listing_url] = cached
+            scanned, dimension_groups = cached
+            groups = bind_variant_groups(page, scanned)
+            used_indices: set = set()
+            dimension_results: List[str] = []
+
+            # Build dimension order dynamically based on actual group order on page
+            # First, find which group corresponds to each dimension
+            dimensions_with_group: List[Tuple[int, str, str]] = []  # (group_idx, dim_type, dim_value)
+            
+            if record.variation:
+                group_idx = dimension_groups["variation"]
+                if group_idx is not None:
+                    dimensions_with_group.append((group_idx, "variation", str(record.variation)))
+                    LOGGER.debug("Found colour group at index %d: %s", group_idx, record.variation)
+                else:
+                    LOGGER.debug("No colour group found for row %s (item %s)", record.row_index, record.item_number or record.base_item_id)
+            else:
+                LOGGER.debug("No colour provided for row %s (item %s)", record.row_index, record.item_number or record.base_item_id)
+            
+            if record.size:
+                group_idx = dimension_groups["size"]
+                if group_idx is not None:
+                    dimensions_with_group.append((group_idx, "size", str(record.size)))
+                    LOGGER.debug("Found size group at index %d: %s", group_idx, record.size)
+                else:
+                    LOGGER.debug("No size group found for row %s (item %s)", record.row_index, record.item_number or record.base_item_id)
+            else:
+                LOGGER.debug("No size provided for row %s (item %s)", record.row_index, record.item_number or record.base_item_id)
+            
+            # Sort by group index to process in page order (color-first or size-first)
+            dimensions_with_group.sort(key=lambda x: x[0])
+            LOGGER.debug("Processing dimensions in page order: %s", [(dt, dv) for _, dt, dv in dimensions_with_group])
+
+            selection_failed = False
+            stale_groups = False
+            for group_idx, dim_type, dim_value in dimensions_with_group:
+                if group_idx in used_indices:
+                    LOGGER.warning("Group %d already used, skipping", group_idx)
+                    continue
+                used_indices.add(group_idx)
+                group = groups[group_idx]
+                ok, failure_reason = await select_option_from_group(page, group, dim_value, idle_ms)
+                if not ok:
+                    reason_lower = (failure_reason or "").lower()
+                    if any(keyword in reason_lower for keyword in ["out of stock", "disabled", "aria-disabled"]):
+                        availability = "OUT_OF_STOCK"
+                    else:
+                        availability = "ERROR"
+                        # The listing layout may have changed under the cached
+                        # groups; the next attempt scans the page afresh
+                        if from_cache:
+                            VARIANT_GROUP_CACHE.pop(record.listing_url, None)
+                            stale_groups = True
+                    error_message = failure_reason
+                    selection_failed = True
+                    break
+                dimension_results.append(dim_value)
+
+            if stale_groups:
+                LOGGER.debug("Cached variant groups failed for %s, rescanning", record.listing_url)
+                continue
+            if selection_failed:
+                break
+
+            await wait_for_network_quiet(page, idle_ms)
+
+            try:
+                await page.wait_for_load_state("domcontentloaded", timeout=3000)
+            except PlaywrightTimeoutError:
+                pass
+
+            availability, availability_detail = await evaluate_availability(page)
+            error_message = availability_detail if availability == "OUT_OF_STOCK" and availability_detail else None
+            break
+        except ChallengeDetected as exc:
+            error_message = str(exc)
+            availability = "BLOCKED"
+            LOGGER.warning("Challenge detected during Chromium check for %s", record.listing_url)
+            await page.wait_for_timeout(delay * 1000)
+        except PlaywrightTimeoutError as exc:
+            error_message = f"Timeout: {exc}"
+            availability = "ERROR"
+            LOGGER.exception("Timeout for %s", record.listing_url)
+            VARIANT_GROUP_CACHE.pop(record.listing_url, None)
+            await page.wait_for_timeout(delay * 1000)
+        except Exception as exc:  # pylint: disable=broad-except
+            error_message = str(exc)
+            availability = "ERROR"
+            LOGGER.exception("Chromium processing failed for %s", record.listing_url)
+            VARIANT_GROUP_CACHE.pop(record.listing_url, None)
+            await page.wait_for_timeout(delay * 1000)
+    return availability, error_message
+
+
+CHROMIUM_CONTEXT_OPTIONS = {
+    "viewport": {"width": 1366, "height": 900},
+    "user_agent": DEFAULT_HEADERS["User-Agent"],
+    "locale": "en-GB",
+    "accept_downloads": False,
+    "ignore_https_errors": True,
+}
+
+
+# Page weight the variant checks never look at. Stylesheets stay: the listbox
+# visibility waits depend on them.
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+
+
+async def block_heavy_resources(route: Any) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def configure_context(context: Any, cookies: List[Dict[str, str]]) -> None:
+    context.set_default_timeout(45000)
+    context.set_default_navigation_timeout(45000)
+    await context.add_init_script(INFLIGHT_COUNTER_JS)
+    await context.route("**/*", block_heavy_resources)
+    if cookies:
+        try:
+            await context.add_cookies(cookies)
+        except Exception as exc:  # pragma: no cover
+            LOGGER.warning("Failed to set cookies: %s", exc)
+
+
+# Records a page serves before it is closed and reopened in the same context,
+# which is cheaper than a new context and keeps its cookies
+PAGE_RESET_AFTER = 50
+
+
+class BrowserContextPool:
+    """Pre-opened pages, each in its own browser context, checked out one record at a time.
+
+    Long-lived pages accumulate DOM and JS heap, so a page is reopened in its
+    context every ``page_reset_after`` records and the whole context is
+    replaced every ``recycle_after`` records, or as soon as the page has
+    crashed. With a ``shared_context`` (a persistent profile) only the pages
+    are reset, as closing that context would close the browser.
+    """
+
+    def __init__(
+        self,
+        browser: Any,
+        cookies: List[Dict[str, str]],
+        size: int,
+        recycle_after: int = 100,
+        shared_context: Any = None,
+        page_reset_after: int = PAGE_RESET_AFTER,
+    ) -> None:
+        self.browser = browser
+        self.cookies = cookies
+        self.size = max(1, size)
+        self.recycle_after = max(1, recycle_after)
+        self.page_reset_after = max(1, page_reset_after)
+        self.shared_context = shared_context
+        self.idle: asyncio.Queue = asyncio.Queue()
+        self.page_uses: Dict[Any, int] = {}
+        self.context_uses: Dict[Any, int] = {}
+
+    async def start(self) -> None:
+        if self.shared_context is not None:
+            await configure_context(self.shared_context, self.cookies)
+        for _ in range(self.size):
+            self.idle.put_nowait(await self.open_page())
+
+    async def open_page(self, context: Any = None) -> Any:
+        if context is None:
+            context = self.shared_context
+        if context is None:
+            context = await self.browser.new_context(**CHROMIUM_CONTEXT_OPTIONS)
+            await configure_context(context, self.cookies)
+        self.context_uses.setdefault(context, 0)
+        page = await context.new_page()
+        self.page_uses[page] = 0
+        return page
+
+    async def acquire(self) -> Any:
+        page = await self.idle.get()
+        self.page_uses[page] += 1
+        self.context_uses[page.context] += 1
+        return page
+
+    async def release(self, page: Any) -> None:
+        context = page.context
+        crashed = page.is_closed()
+        renew_context = self.shared_context is None and (crashed or self.context_uses[context] >= self.recycle_after)
+        if renew_context or crashed or self.page_uses[page] >= self.page_reset_after:
+            served = self.page_uses.pop(page)
+            try:
+                if renew_context:
+                    LOGGER.debug("Recycling browser context after %d records", self.context_uses.pop(context))
+                    await context.close()
+                else:
+                    LOGGER.debug("Reopening browser page after %d records", served)
+                    await page.close()
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.debug("Closing recycled page failed: %s", exc)
+            page = await self.open_page(None if renew_context else context)
+        self.idle.put_nowait(page)
+
+
+async def check_all_chromium(
     records: List[VariantRecord],
     delay: float,
     max_retries: int,
     cookie_header: Optional[str],
     user_data_dir: Optional[Path],
-) -> pd.DataFrame:
-    if sync_playwright is None:
-        raise RuntimeError("Playwright is not installed. Run 'pip install playwright' and 'playwright install chromium'.")
+    workers: int = 1,
+    recycle_after: int = 100,
+    idle_ms: int = DEFAULT_IDLE_MS,
+) -> List[Tuple[str, Optional[str]]]:
+    """Check ``records`` on up to ``workers`` pages at once, each in its own browser context.
 
-    results: List[Dict[str, Any]] = []
-    with sync_playwright() as p:
+    Returns the detected status and last error for each record, in input order.
+    """
+    cookies = [
+        {"name": name, "value": value, "domain": ".ebay.co.uk", "path": "/"}
+        for name, value in parse_cookie_header(cookie_header).items()
+    ]
+    async with async_playwright() as p:
         browser = None
-        context = None
+        shared_context = None
         if user_data_dir:
-            context = p.chromium.launch_persistent_context(
-                str(user_data_dir),
-                headless=False,
-                viewport={"width": 1366, "height": 900},
-                user_agent=DEFAULT_HEADERS["User-Agent"],
-                locale="en-GB",
-                accept_downloads=False,
-                ignore_https_errors=True,
+            # A profile directory backs a single context, so its pages share it
+            shared_context = await p.chromium.launch_persistent_context(
+                str(user_data_dir), headless=False, **CHROMIUM_CONTEXT_OPTIONS
             )
         else:
-            browser = p.chromium.launch(headless=False)
-            context = browser.new_context(
-                viewport={"width": 1366, "height": 900},
-                user_agent=DEFAULT_HEADERS["User-Agent"],
-                locale="en-GB",
-                accept_downloads=False,
-                ignore_https_errors=True,
-            )
+            browser = await p.chromium.launch(headless=False)
+        pool = BrowserContextPool(browser, cookies, min(workers, len(records)), recycle_after, shared_context)
 
-        assert context is not None  # narrow type checker
-        context.set_default_timeout(45000)
-        context.set_default_navigation_timeout(45000)
+        outcomes: List[Tuple[str, Optional[str]]] = [("BLOCKED", None)] * len(records)
 
-        if cookie_header:
-            cookies = []
-            for chunk in cookie_header.split(";"):
-                chunk = chunk.strip()
-                if not chunk or "=" not in chunk:
-                    continue
-                name, value = chunk.split("=", 1)
-                cookies.append({
-                    "name": name.strip(),
-                    "value": value.strip(),
-                    "domain": ".ebay.co.uk",
-                    "path": "/",
-                })
-            if cookies:
-                try:
-                    context.add_cookies(cookies)
-                except Exception as exc:  # pragma: no cover
-                    LOGGER.warning("Failed to set cookies: %s", exc)
-
-        page = context.new_page()
-        for index, record in enumerate(records, start=1):
-            LOGGER.info("[Chromium %s/%s] Checking item %s", index, len(records), record.item_number or record.base_item_id)
-            attempts = 0
-            availability = "BLOCKED"
-            error_message: Optional[str] = None
-            while attempts <= max_retries:
-                attempts += 1
-                try:
-                    page.goto(
-                        record.listing_url,
-                        wait_until="domcontentloaded",
-                        timeout=45000,
-                    )
-                    try:
-                        page.wait_for_load_state("networkidle", timeout=5000)
-                    except PlaywrightTimeoutError:
-                        pass
-                    page.wait_for_timeout(800)
-                    if detect_challenge(page):
-                        raise ChallengeDetected("Bot challenge page encountered")
-
-                    groups = collect_variant_groups(page)
-                    used_indices: set = set()
-                    dimension_results: List[str] = []
-
-                    # Build dimension order dynamically based on actual group order on page
-                    # First, find which group corresponds to each dimension
-                    dimensions_with_group: List[Tuple[int, str, str]] = []  # (group_idx, dim_type, dim_value)
-                    
-                    if record.variation:
-                        group_idx = find_group_for_dimension(groups, "variation", set())
-                        if group_idx is not None:
-                            dimensions_with_group.append((group_idx, "variation", str(record.variation)))
-                            LOGGER.debug("Found colour group at index %d: %s", group_idx, record.variation)
-                        else:
-                            LOGGER.debug("No colour group found for row %s (item %s)", record.row_index, record.item_number or record.base_item_id)
-                    else:
-                        LOGGER.debug("No colour provided for row %s (item %s)", record.row_index, record.item_number or record.base_item_id)
-                    
-                    if record.size:
-                        group_idx = find_group_for_dimension(groups, "size", set())
-                        if group_idx is not None:
-                            dimensions_with_group.append((group_idx, "size", str(record.size)))
-                            LOGGER.debug("Found size group at index %d: %s", group_idx, record.size)
-                        else:
-                            LOGGER.debug("No size group found for row %s (item %s)", record.row_index, record.item_number or record.base_item_id)
-                    else:
-                        LOGGER.debug("No size provided for row %s (item %s)", record.row_index, record.item_number or record.base_item_id)
-                    
-                    # Sort by group index to process in page order (color-first or size-first)
-                    dimensions_with_group.sort(key=lambda x: x[0])
-                    LOGGER.debug("Processing dimensions in page order: %s", [(dt, dv) for _, dt, dv in dimensions_with_group])
-
-                    selection_failed = False
-                    for group_idx, dim_type, dim_value in dimensions_with_group:
-                        if group_idx in used_indices:
-                            LOGGER.warning("Group %d already used, skipping", group_idx)
-                            continue
-                        used_indices.add(group_idx)
-                        group = groups[group_idx]
-                        ok, failure_reason = select_option_from_group(page, group, dim_value)
-                        if not ok:
-                            reason_lower = (failure_reason or "").lower()
-                            if any(keyword in reason_lower for keyword in ["out of stock", "disabled", "aria-disabled"]):
-                                availability = "OUT_OF_STOCK"
-                            else:
-                                availability = "ERROR"
-                            error_message = failure_reason
-                            selection_failed = True
-                            break
-                        dimension_results.append(dim_value)
-
-                    if selection_failed:
-                        break
-
-                    try:
-                        page.wait_for_load_state("networkidle", timeout=5000)
-                    except PlaywrightTimeoutError:
-                        LOGGER.debug("Network not idle after variant selection, continuing anyway")
-                    
-                    page.wait_for_timeout(1000)
-                    
-                    try:
-                        page.wait_for_load_state("domcontentloaded", timeout=3000)
-                    except PlaywrightTimeoutError:
-                        pass
-
-                    availability, availability_detail = evaluate_availability(page)
-                    error_message = availability_detail if availability == "OUT_OF_STOCK" and availability_detail else None
-                    break
-                except ChallengeDetected as exc:
-                    error_message = str(exc)
-                    availability = "BLOCKED"
-                    LOGGER.warning("Challenge detected during Chromium check for %s", record.listing_url)
-                    page.wait_for_timeout(delay * 1000)
-                except PlaywrightTimeoutError as exc:
-                    error_message = f"Timeout: {exc}"
-                    availability = "ERROR"
-                    LOGGER.exception("Timeout for %s", record.listing_url)
-                    page.wait_for_timeout(delay * 1000)
-                except Exception as exc:  # pylint: disable=broad-except
-                    error_message = str(exc)
-                    availability = "ERROR"
-                    LOGGER.exception("Chromium processing failed for %s", record.listing_url)
-                    page.wait_for_timeout(delay * 1000)
-            results.append(
-                {
-                    "row_index": record.row_index,
-                    "excel_row": record.excel_row,
-                    "sheet_sr_no": record.sr_no,
-                    "stock_name": record.stock_name,
-                    "variation": record.variation,
-                    "size": record.size,
-                    "dimensions": record.dimensions,
-                    "sheet_stock_status": record.sheet_stock_status,
-                    "detected_status": availability,
-                    "item_number": record.item_number or record.base_item_id,
-                    "variation_id": record.variation_id,
-                    "listing_url": record.listing_url,
-                    "error": error_message,
-                }
-            )
-            if index < len(records):
-                page.wait_for_timeout(delay * 1000)
+        # Each check holds a page for its whole run, so at most ``workers`` are in flight
+        async def check(index: int, record: VariantRecord) -> None:
+            page = await pool.acquire()
+            try:
+                outcomes[index - 1] = await check_record_chromium(
+                    page, record, delay, max_retries, index, len(records), idle_ms
+                )
+                if index < len(records):
+                    await page.wait_for_timeout(delay * 1000)
+            finally:
+                await pool.release(page)
 
-        if browser is not None:
-            browser.close()
-        else:
-            context.close()
+        try:
+            await pool.start()
+            await asyncio.gather(*(check(index, record) for index, record in enumerate(records, start=1)))
+        finally:
+            if browser is not None:
+                await browser.close()
+            else:
+                await shared_context.close()
+    return outcomes
 
-    return pd.DataFrame(results)
+
+def process_variants_chromium(
+    records: List[VariantRecord],
+    delay: float,
+    max_retries: int,
+    cookie_header: Optional[str],
+    user_data_dir: Optional[Path],
+    workers: int = 1,
+    recycle_after: int = 100,
+    idle_ms: int = DEFAULT_IDLE_MS,
+) -> pd.DataFrame:
+    if async_playwright is None:
+        raise RuntimeError("Playwright is not installed. Run 'pip install playwright' and 'playwright install chromium'.")
+    outcomes = asyncio.run(
+        check_all_chromium(
+            records, delay, max_retries, cookie_header, user_data_dir, workers, recycle_after, idle_ms
+        )
+    )
+    return pd.DataFrame([result_row(record, *outcome) for record, outcome in zip(records, outcomes)])
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
@@ -1058,7 +1954,7 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         "--delay",
         type=float,
         default=3.0,
-        help="Delay in seconds between requests (default: 3.0).",
+        help="Delay in seconds between requests (default: 3.0). The requests engine only paces by it once eBay starts challenging, and backs off exponentially from it after failures.",
     )
     parser.add_argument(
         "--cookie",
@@ -1072,6 +1968,30 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=2,
         help="Number of retries when encountering errors or challenges (default: 2).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of concurrent fetches for the requests engine, or of browser contexts checking rows in parallel for the chromium engine (default: 1).",
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Fetch with httpx.AsyncClient on a single event loop; --workers sets the requests in flight (requests engine only).",
+    )
+    parser.add_argument(
+        "--http-cache",
+        type=Path,
+        default=None,
+        help="Optional SQLite file storing ETag/Last-Modified validators so repeat runs of the requests engine send conditional GETs.",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help="Optional CSV file that receives each result as soon as its listing is checked. Rerunning with the same file resumes, skipping listings already resolved there (requests engine only).",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -1089,13 +2009,40 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=None,
         help="Optional directory for persistent Chromium user data (helps retain login).",
     )
+    parser.add_argument(
+        "--recycle-after",
+        type=int,
+        default=100,
+        help="Replace each Chromium page and its browser context after this many rows to bound browser memory on long runs (default: 100).",
+    )
+    parser.add_argument(
+        "--idle-ms",
+        type=int,
+        default=DEFAULT_IDLE_MS,
+        help=f"Milliseconds without fetch/XHR traffic after which a Chromium page counts as settled (default: {DEFAULT_IDLE_MS}).",
+    )
     return parser.parse_args(argv)
 
 
+STATUS_HEADERS = {"STATUS", "INSTOCK/OUTOFSTOCK"}
+PREFERRED_STATUS_LETTER = "I"
+
+
+def resolve_status_column(ws: Any) -> int:
+    """Return the 1-based STATUS column of ``ws`` (handles column shifts)."""
+    for row in ws.iter_rows(min_row=1, max_row=10, values_only=True):
+        for column, value in enumerate(row, start=1):
+            if isinstance(value, str) and value.strip().upper() in STATUS_HEADERS:
+                return column
+    # Fallback to explicit column letter if headers have been renamed
+    from openpyxl.utils import column_index_from_string
+
+    return column_index_from_string(PREFERRED_STATUS_LETTER)
+
+
 def update_sheet_with_results(input_path: Path, output_path: Path, results_df: pd.DataFrame) -> None:
     from datetime import datetime
     from openpyxl import load_workbook
-    from openpyxl.utils import column_index_from_string
     from shutil import copy2
 
     status_normalization = {
@@ -1106,15 +2053,17 @@ def update_sheet_with_results(input_path: Path, output_path: Path, results_df: p
         "UNKNOWN": "ERROR",  # Treat unknown as error
     }
 
-    status_by_row = {}
-    for _, row in results_df.iterrows():
-        excel_row = int(row["excel_row"])
-        detected = row["detected_status"]
-        if isinstance(detected, str):
-            detected_clean = status_normalization.get(detected, detected.replace("_", " "))
-        else:
-            detected_clean = detected
-        status_by_row[excel_row] = detected_clean
+    def clean_status(status: Any) -> Any:
+        if isinstance(status, str):
+            return status_normalization.get(status, status.replace("_", " "))
+        return status
+
+    # Known statuses map to their sheet wording, other strings get spaces for
+    # underscores and missing values pass through unchanged. Mapping a
+    # categorical only visits its handful of distinct statuses.
+    detected = results_df["detected_status"]
+    cleaned = detected.astype("category").map(clean_status).astype(object).where(detected.notna(), detected.astype(object))
+    status_by_row = dict(zip(results_df["excel_row"].astype(int).tolist(), cleaned.tolist()))
 
     # Prepare backup directory
     backup_dir = input_path.parent / "backups"
@@ -1123,41 +2072,36 @@ def update_sheet_with_results(input_path: Path, output_path: Path, results_df: p
     backup_path = backup_dir / f"{input_path.stem}_{timestamp}{input_path.suffix}"
     copy2(input_path, backup_path)
 
-    preferred_status_letter = "I"
-
-    # Helper to resolve the STATUS column dynamically (handles column shifts)
-    def resolve_status_column(ws):
-        header_candidates = {"STATUS", "INSTOCK/OUTOFSTOCK"}
-        for row in ws.iter_rows(min_row=1, max_row=10):
-            for cell in row:
-                if cell.value is None:
-                    continue
-                if isinstance(cell.value, str) and cell.value.strip().upper() in header_candidates:
-                    return cell.column
-        # Fallback to explicit column letter if headers have been renamed
-        return column_index_from_string(preferred_status_letter)
-
     # Update original file in place
     original_wb = load_workbook(input_path)
     original_ws = original_wb.active
     status_col_index = resolve_status_column(original_ws)
-    for excel_row, status in status_by_row.items():
-        original_ws.cell(row=excel_row, column=status_col_index).value = status
+    for excel_row, status in sorted(status_by_row.items()):
+        original_ws.cell(row=excel_row, column=status_col_index, value=status)
     original_wb.save(input_path)
     original_wb.close()
 
+    # The copy already carries the updated STATUS column
     copy2(input_path, output_path)
 
-    # Re-open the saved copy and update only the resolved STATUS column (defaults to column I)
-    copy_wb = load_workbook(output_path)
-    copy_ws = copy_wb.active
-    status_col_index = resolve_status_column(copy_ws)
 
-    for excel_row, status in status_by_row.items():
-        copy_ws.cell(row=excel_row, column=status_col_index).value = status
+def write_results_xlsx(results_df: pd.DataFrame, output_path: Path) -> None:
+    """Write ``results_df`` with xlsxwriter in constant-memory mode.
 
-    copy_wb.save(output_path)
-    copy_wb.close()
+    Each row is flushed to disk once the next one starts, so rows must be
+    written in order; pandas' own xlsxwriter path writes column by column and
+    would lose cells in this mode.
+    """
+    # Listing URLs stay plain text, as openpyxl writes them
+    workbook = xlsxwriter.Workbook(str(output_path), {"constant_memory": True, "strings_to_urls": False})
+    try:
+        worksheet = workbook.add_worksheet()
+        worksheet.write_row(0, 0, [str(column) for column in results_df.columns])
+        values = results_df.astype(object).where(results_df.notna(), None)
+        for row_number, row in enumerate(values.itertuples(index=False, name=None), start=1):
+            worksheet.write_row(row_number, 0, row)
+    finally:
+        workbook.close()
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -1188,10 +2132,33 @@ def main(argv: Optional[List[str]] = None) -> int:
         records = records[args.offset:]
 
     if args.engine == "chromium":
-        results_df = process_variants_chromium(records, args.delay, args.retries, args.cookie, args.chromium_profile)
+        results_df = process_variants_chromium(
+            records, args.delay, args.retries, args.cookie, args.chromium_profile,
+            args.workers, args.recycle_after, args.idle_ms,
+        )
     else:
-        session = create_session(DEFAULT_HEADERS.copy(), args.cookie)
-        results_df = process_variants_requests(records, session, args.delay, args.retries)
+        cache = ListingCache(args.http_cache) if args.http_cache else None
+        checkpoint = ResultCheckpoint(args.checkpoint) if args.checkpoint else None
+        try:
+            if args.use_async and httpx is not None:
+                results_df = process_variants_async(
+                    records, args.cookie, args.delay, args.retries, args.workers, cache, checkpoint
+                )
+            else:
+                if args.use_async:
+                    LOGGER.warning("httpx is not installed; falling back to the threaded requests engine.")
+                session = create_session(DEFAULT_HEADERS.copy(), args.cookie, pool_size=args.workers)
+                results_df = process_variants_requests(
+                    records, session, args.delay, args.retries, args.workers, cache, checkpoint
+                )
+        finally:
+            if cache is not None:
+                cache.close()
+            if checkpoint is not None:
+                checkpoint.close()
+
+    # A handful of distinct statuses repeated on every row
+    results_df["detected_status"] = results_df["detected_status"].astype("category")
 
     sample = results_df.head()
     LOGGER.info("Sample results:\n%s", sample)
@@ -1199,9 +2166,12 @@ def main(argv: Optional[List[str]] = None) -> int:
     if args.output:
         output_path = args.output
         if output_path.suffix.lower() in {".xlsx", ".xls"}:
-            results_df.to_excel(output_path, index=False)
+            if xlsxwriter is not None:
+                write_results_xlsx(results_df, output_path)
+            else:
+                results_df.to_excel(output_path, index=False)
         else:
-            results_df.to_csv(output_path, index=False)
+            results_df.to_csv(output_path, index=False, chunksize=10000)
         LOGGER.info("Results saved to %s", output_path)
     else:
         print(results_df.to_string(index=False))
@@ -0,0 +1,141 @@
+"""Parquet sidecar cache for the workbooks inspected by the check scripts.
+
+Parsing an XLSX file means unzipping and walking every cell of the sheet XML.
+The diagnostic scripts re-read the same workbook on every run, so the first
+read writes a ``<name>.xlsx.parquet`` file next to the workbook and later reads
+load that columnar copy for as long as it is newer than the workbook itself.
+Within one process the parsed frame is also memoised per workbook mtime.
+
+``load_stock_sheet`` adds the header handling the stock sheet needs: its
+labels sit in the first data row and are promoted to column names.
+
+Usage:
+    from excel_cache import load_sheet, load_stock_sheet
+    df = load_sheet("ECOMWITH YASIR STOCK PRODUCTS SHEET (1).xlsx")
+    stock = load_stock_sheet("ECOMWITH YASIR STOCK PRODUCTS SHEET (1).xlsx", usecols=["Colour", "SIZE"])
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+try:  # pragma: no cover - optional dependency for the parquet sidecar
+    import pyarrow  # type: ignore  # noqa: F401
+except ImportError:  # pragma: no cover
+    pyarrow = None  # type: ignore
+
+try:  # pragma: no cover - optional Rust-backed reader, openpyxl is the fallback
+    import python_calamine  # type: ignore  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:  # pragma: no cover
+    EXCEL_ENGINE = "openpyxl"
+
+
+LOGGER = logging.getLogger("excel_cache")
+
+
+def cache_path_for(path: Path) -> Path:
+    return path.with_name(path.name + ".parquet")
+
+
+def _stringify_cell(value: object) -> object:
+    """Return ``str(value)``, leaving missing values (None, NaN, NaT, NA) as they are.
+
+    Plain type checks instead of ``pd.isna``, which is slow on scalars.
+    """
+    if value is None or value is pd.NaT or value is pd.NA:
+        return value
+    if isinstance(value, float) and math.isnan(value):
+        return value
+    return str(value)
+
+
+def _coerce_mixed_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Stringify object columns mixing several value types.
+
+    The sheet keeps its real header labels in the first data row, so most
+    columns hold a string followed by numbers. Parquet needs one type per
+    column; missing values are left untouched.
+    """
+    for col in df.columns:
+        series = df[col]
+        if series.dtype != object:
+            continue
+        if series.dropna().map(type).nunique() > 1:
+            df[col] = series.map(_stringify_cell)
+    return df
+
+
+@lru_cache(maxsize=8)
+def _load_sheet_cached(path: Path, mtime: float) -> pd.DataFrame:
+    """Load ``path`` once per (path, mtime) pair within the current process."""
+    cache = cache_path_for(path)
+    if pyarrow is not None and cache.exists() and os.path.getmtime(cache) >= os.path.getmtime(path):
+        LOGGER.debug("Loading cached sheet %s", cache)
+        return pd.read_parquet(cache)
+
+    df = _coerce_mixed_columns(pd.read_excel(path, engine=EXCEL_ENGINE))
+    if pyarrow is not None:
+        try:
+            df.to_parquet(cache, compression="zstd")
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.warning("Could not write parquet cache %s: %s", cache, exc)
+            cache.unlink(missing_ok=True)
+    return df
+
+
+def load_sheet(path: Union[str, Path]) -> pd.DataFrame:
+    """Read the first worksheet of ``path``, reusing a fresh parquet sidecar if present.
+
+    Repeated calls in one process share a single parse until the workbook's
+    modification time changes. Each caller gets its own copy, so renaming
+    columns or slicing rows never leaks into later calls.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(path)
+    return _load_sheet_cached(path.resolve(), os.path.getmtime(path)).copy()
+
+
+def load_stock_sheet(
+    path: Union[str, Path],
+    *,
+    usecols: Optional[Sequence[str]] = None,
+    nrows: Optional[int] = None,
+    dtype: Optional[Mapping[str, str]] = None,
+) -> pd.DataFrame:
+    """Read the stock sheet with its header row promoted to column labels.
+
+    Non-blank string cells of the first data row become the column names
+    (stripped); other columns keep their original name. The returned frame
+    starts at the first product row with a fresh 0-based index, so index
+    ``i`` is sheet row ``i + 3``. ``usecols`` picks columns by promoted
+    label, ``nrows`` keeps the first rows and ``dtype`` maps labels to
+    dtypes such as ``"string"`` or ``"category"``. Labels absent from the
+    sheet are skipped by both ``usecols`` and ``dtype``.
+    """
+    df = load_sheet(path)
+    if df.empty:
+        return df
+    header = df.iloc[0]
+    # Keep only non-blank string labels. Mapping per cell works whatever the
+    # row's dtype; an all-numeric row has no .str accessor
+    labels = header.map(lambda value: value.strip() if isinstance(value, str) else np.nan)
+    df.columns = np.where(labels.notna() & labels.ne(""), labels, df.columns)
+    df = df.iloc[1:].reset_index(drop=True)
+
+    if usecols is not None:
+        df = df[[label for label in usecols if label in df.columns]]
+    if nrows is not None:
+        df = df.iloc[:nrows]
+    if dtype:
+        df = df.astype({label: kind for label, kind in dtype.items() if label in df.columns})
+    return df
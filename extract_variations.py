@@ -1,93 +1,108 @@
-from playwright.sync_api import sync_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
+import asyncio
 import json
 
-def extract_variation_details():
-    url = "https://www.ebay.co.uk/itm/363486576357"
+URLS = ["https://www.ebay.co.uk/itm/363486576357"]
+
+# Listings extracted at once, each in its own browser context
+MAX_CONCURRENCY = 5
+
+# Reads the variation container in one browser round-trip: its full HTML,
+# then per listbox button the label, current value, options and button HTML
+VARIATIONS_JS = '''container => {
+    const describeOption = el => {
+        const valueEl = el.querySelector('.listbox__value');
+        const value = valueEl ? valueEl.textContent.replace('selected', '').trim() : '';
+        
+        const descEl = el.querySelector('.listbox__description, .x-sku-description');
+        const description = descEl ? descEl.textContent.trim() : '';
+        
+        return {
+            value: value,
+            description: description,
+            is_active: el.classList.contains('listbox__option--active'),
+            is_disabled: el.hasAttribute('aria-disabled') && el.getAttribute('aria-disabled') === 'true',
+            class_list: Array.from(el.classList),
+            data_sku_value: el.getAttribute('data-sku-value-name'),
+            outer_html: el.outerHTML.substring(0, 500)
+        };
+    };
     
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    const variations = Array.from(container.querySelectorAll('.listbox-button')).map(button => {
+        const labelEl = button.querySelector('.btn__label');
+        const textEl = button.querySelector('.btn__text');
+        const variation = {
+            label: labelEl ? labelEl.textContent.trim() : '',
+            current_value: textEl ? textEl.textContent.trim() : ''
+        };
+        const optionsContainer = button.querySelector('.listbox__options');
+        if (optionsContainer) {
+            variation.options = Array.from(optionsContainer.querySelectorAll('.listbox__option')).map(describeOption);
+        }
+        variation.button_html = button.outerHTML;
+        return variation;
+    });
+    
+    return {full_variation_html: container.outerHTML, variations: variations};
+}'''
+
+# Page weight the DOM extraction never looks at
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+
+async def block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def extract_variation_details(browser, url):
+    context = await browser.new_context()
+    await context.route("**/*", block_heavy_resources)
+    try:
+        page = await context.new_page()
         
         print(f"Navigating to {url}...")
-        page.goto(url, wait_until="networkidle", timeout=60000)
-        page.wait_for_timeout(3000)
+        await page.goto(url, wait_until="domcontentloaded", timeout=30000)
         
-        # Find the variation container
-        variation_container = page.query_selector('[data-testid="x-msku-evo"]')
+        # Find the variation container as soon as it renders; listings
+        # without variations simply never show it
+        try:
+            variation_container = await page.wait_for_selector('[data-testid="x-msku-evo"]', timeout=10000)
+        except PlaywrightTimeoutError:
+            variation_container = None
         
         results = {}
         
         if variation_container:
-            # Get full HTML of the variation container
-            full_html = variation_container.evaluate('el => el.outerHTML')
-            results['full_variation_html'] = full_html
-            
-            # Find all listbox buttons (Size, Colour, etc.)
-            listbox_buttons = variation_container.query_selector_all('.listbox-button')
-            
-            results['variations'] = []
-            
-            for idx, button in enumerate(listbox_buttons):
-                variation_data = {}
-                
-                # Get the button label (Size:, Colour:, etc.)
-                label = button.evaluate('''el => {
-                    const labelEl = el.querySelector('.btn__label');
-                    return labelEl ? labelEl.textContent.trim() : '';
-                }''')
-                variation_data['label'] = label
-                
-                # Get current selected value
-                current_value = button.evaluate('''el => {
-                    const textEl = el.querySelector('.btn__text');
-                    return textEl ? textEl.textContent.trim() : '';
-                }''')
-                variation_data['current_value'] = current_value
-                
-                # Get all options from the listbox
-                options_container = button.query_selector('.listbox__options')
-                if options_container:
-                    options = options_container.query_selector_all('.listbox__option')
-                    variation_data['options'] = []
-                    
-                    for opt in options:
-                        option_info = opt.evaluate('''el => {
-                            const valueEl = el.querySelector('.listbox__value');
-                            const value = valueEl ? valueEl.textContent.replace('selected', '').trim() : '';
-                            
-                            const descEl = el.querySelector('.listbox__description, .x-sku-description');
-                            const description = descEl ? descEl.textContent.trim() : '';
-                            
-                            const isActive = el.classList.contains('listbox__option--active');
-                            const isDisabled = el.hasAttribute('aria-disabled') && el.getAttribute('aria-disabled') === 'true';
-                            const classList = Array.from(el.classList);
-                            const dataSkuValue = el.getAttribute('data-sku-value-name');
-                            
-                            return {
-                                value: value,
-                                description: description,
-                                is_active: isActive,
-                                is_disabled: isDisabled,
-                                class_list: classList,
-                                data_sku_value: dataSkuValue,
-                                outer_html: el.outerHTML.substring(0, 500)
-                            };
-                        }''')
-                        variation_data['options'].append(option_info)
-                
-                variation_data['button_html'] = button.evaluate('el => el.outerHTML')
-                results['variations'].append(variation_data)
+            # The container HTML and every listbox (Size, Colour, etc.) with
+            # its options come back from a single evaluate call
+            results = await variation_container.evaluate(VARIATIONS_JS)
         
-        browser.close()
         return results
+    finally:
+        await context.close()
+
+async def extract_variation_details_batch(urls, max_concurrency=MAX_CONCURRENCY):
+    """Extract every listing in ``urls`` on one browser, returning results in input order."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            async def one(url):
+                async with semaphore:
+                    return await extract_variation_details(browser, url)
+
+            return await asyncio.gather(*(one(url) for url in urls))
+        finally:
+            await browser.close()
 
-def save_results(data):
-    output_file = "d:\\stock check scrapper\\dom_structure_analysis.txt"
+def save_results(data, url, suffix=""):
+    output_file = f"d:\\stock check scrapper\\dom_structure_analysis{suffix}.txt"
     
     with open(output_file, 'w', encoding='utf-8') as f:
         f.write("=" * 80 + "\n")
         f.write("EBAY VARIATION DROPDOWN ANALYSIS\n")
-        f.write("URL: https://www.ebay.co.uk/itm/363486576357\n")
+        f.write(f"URL: {url}\n")
         f.write("=" * 80 + "\n\n")
         
         if 'variations' in data:
@@ -155,13 +170,16 @@ def save_results(data):
     print(f"\nAnalysis saved to: {output_file}")
     
     # Also save JSON for programmatic use
-    json_file = "d:\\stock check scrapper\\variation_structure.json"
+    json_file = f"d:\\stock check scrapper\\variation_structure{suffix}.json"
     with open(json_file, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
     print(f"JSON data saved to: {json_file}")
 
 if __name__ == "__main__":
     print("Extracting variation dropdown details...\n")
-    data = extract_variation_details()
-    save_results(data)
+    batch = asyncio.run(extract_variation_details_batch(URLS))
+    for url, data in zip(URLS, batch):
+        # A single listing keeps the original file names
+        suffix = "" if len(URLS) == 1 else "_" + url.rstrip("/").rsplit("/", 1)[-1]
+        save_results(data, url, suffix)
     print("\nDone!")
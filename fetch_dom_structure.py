@@ -1,189 +1,359 @@
-from playwright.sync_api import sync_playwright
-import time
+from urllib import request
+from urllib.parse import urlparse
+import asyncio
+import re
 
-def fetch_ebay_dom_structure():
-    url = "https://www.ebay.co.uk/itm/363486576357"
-    
-    with sync_playwright() as p:
-        # Launch browser
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        
-        print(f"Navigating to {url}...")
-        page.goto(url, wait_until="networkidle", timeout=60000)
-        
-        # Wait for the page to load completely
-        print("Waiting for page to load completely...")
-        time.sleep(3)
-        
-        # Try to find Size dropdown
-        print("\n=== Looking for Size dropdown ===")
-        size_selectors = [
-            'select[aria-label*="Size"]',
-            'select[name*="size"]',
-            'div:has-text("Size:")',
-            '[data-testid*="size"]',
-            'select.x-msku__select-box',
-            'select[id*="msku"]'
-        ]
-        
-        size_html = None
-        size_selector_used = None
-        for selector in size_selectors:
-            try:
-                element = page.query_selector(selector)
-                if element:
-                    size_html = element.evaluate('el => el.outerHTML')
-                    size_selector_used = selector
-                    print(f"Found with selector: {selector}")
-                    break
-            except:
-                continue
-        
-        # Try to find Colour dropdown
-        print("\n=== Looking for Colour dropdown ===")
-        colour_selectors = [
-            'select[aria-label*="Colour"]',
-            'select[aria-label*="Color"]',
-            'select[name*="colour"]',
-            'select[name*="color"]',
-            'div:has-text("Colour:")',
-            '[data-testid*="colour"]',
-            '[data-testid*="color"]',
-            'select.x-msku__select-box',
-        ]
-        
-        colour_html = None
-        colour_selector_used = None
-        for selector in colour_selectors:
-            try:
-                element = page.query_selector(selector)
-                if element:
-                    colour_html = element.evaluate('el => el.outerHTML')
-                    colour_selector_used = selector
-                    print(f"Found with selector: {selector}")
-                    break
-            except:
-                continue
-        
-        # Try to find all select boxes
-        print("\n=== Looking for all select boxes ===")
-        all_selects = page.query_selector_all('select')
-        all_selects_html = []
-        for i, select in enumerate(all_selects):
-            try:
-                html = select.evaluate('el => el.outerHTML')
-                all_selects_html.append((i, html))
-                print(f"Found select box {i+1}")
-            except:
-                continue
-        
-        # Try to find variation containers
-        print("\n=== Looking for variation containers ===")
-        variation_containers = page.query_selector_all('.x-msku__box-cont, [class*="variation"], [class*="msku"]')
-        variation_html = []
-        for i, container in enumerate(variation_containers):
-            try:
-                html = container.evaluate('el => el.outerHTML')
-                variation_html.append((i, html))
-                print(f"Found variation container {i+1}")
-            except:
-                continue
-        
-        # Get full page HTML as backup
-        print("\n=== Getting full page HTML ===")
-        full_html = page.content()
-        
-        browser.close()
-        
-        return {
-            'size_html': size_html,
-            'size_selector': size_selector_used,
-            'colour_html': colour_html,
-            'colour_selector': colour_selector_used,
-            'all_selects': all_selects_html,
-            'variation_containers': variation_html,
-            'full_html': full_html
-        }
-
-def save_dom_analysis(data):
-    output_file = "d:\\stock check scrapper\\dom_structure_analysis.txt"
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write("=" * 80 + "\n")
-        f.write("EBAY DOM STRUCTURE ANALYSIS\n")
-        f.write("URL: https://www.ebay.co.uk/itm/363486576357\n")
-        f.write("=" * 80 + "\n\n")
-        
-        # Size Dropdown Section
-        f.write("=" * 80 + "\n")
-        f.write("SIZE DROPDOWN SECTION\n")
-        f.write("=" * 80 + "\n")
-        if data['size_html']:
-            f.write(f"Selector used: {data['size_selector']}\n\n")
-            f.write(data['size_html'])
-            f.write("\n\n")
-        else:
-            f.write("Size dropdown not found with standard selectors.\n\n")
-        
-        # Colour Dropdown Section
-        f.write("=" * 80 + "\n")
-        f.write("COLOUR DROPDOWN SECTION\n")
-        f.write("=" * 80 + "\n")
-        if data['colour_html']:
-            f.write(f"Selector used: {data['colour_selector']}\n\n")
-            f.write(data['colour_html'])
-            f.write("\n\n")
-        else:
-            f.write("Colour dropdown not found with standard selectors.\n\n")
-        
-        # All Select Boxes Section
-        f.write("=" * 80 + "\n")
-        f.write("ALL SELECT BOXES FOUND ON PAGE\n")
-        f.write("=" * 80 + "\n")
-        if data['all_selects']:
-            for i, html in data['all_selects']:
-                f.write(f"\n--- SELECT BOX #{i+1} ---\n")
-                f.write(html)
-                f.write("\n\n")
-        else:
-            f.write("No select boxes found.\n\n")
-        
-        # Variation Containers Section
-        f.write("=" * 80 + "\n")
-        f.write("VARIATION CONTAINERS\n")
-        f.write("=" * 80 + "\n")
-        if data['variation_containers']:
-            for i, html in data['variation_containers']:
-                f.write(f"\n--- VARIATION CONTAINER #{i+1} ---\n")
-                f.write(html[:2000])  # Limit to first 2000 chars to keep file manageable
-                if len(html) > 2000:
-                    f.write("\n... (truncated)")
-                f.write("\n\n")
+from bs4 import BeautifulSoup
+
+try:  # only needed when a listing's server HTML lacks the variation data
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
+except ImportError:
+    async_playwright = None
+    PlaywrightTimeoutError = Exception
+
+try:  # C parser for the static path, html.parser is the fallback
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+URLS = ["https://www.ebay.co.uk/itm/363486576357"]
+
+# Listings probed at once in the browser, each on its own page
+MAX_CONCURRENCY = 8
+
+SIZE_SELECTORS = [
+    'select[aria-label*="Size"]',
+    'select[name*="size"]',
+    'div:has-text("Size:")',
+    '[data-testid*="size"]',
+    'select.x-msku__select-box',
+    'select[id*="msku"]'
+]
+
+COLOUR_SELECTORS = [
+    'select[aria-label*="Colour"]',
+    'select[aria-label*="Color"]',
+    'select[name*="colour"]',
+    'select[name*="color"]',
+    'div:has-text("Colour:")',
+    '[data-testid*="colour"]',
+    '[data-testid*="color"]',
+    'select.x-msku__select-box',
+]
+
+# Runs the whole probe in the page. The first selector of each list that
+# matches wins; ``tag:has-text("...")`` is Playwright-only syntax, so it is
+# matched here as the first such tag whose text contains the string
+# (case-insensitive, whitespace collapsed), like Playwright does.
+# The lists share selectors and elements (the msku select box is both a
+# select and a variation container), so each selector is queried once and
+# each element serialised once: ``html`` holds the unique markup and the
+# other fields refer to it by index. The script holding itemVariationsMap
+# comes back cut to ``sampleChars`` along with whether it was longer.
+PROBE_JS = """
+({size, colour, sampleChars}) => {
+  const normalise = text => (text || '').replace(/\\s+/g, ' ').toLowerCase();
+  const queried = new Map();
+  const query = selector => {
+    if (queried.has(selector)) return queried.get(selector);
+    let el = null;
+    const hasText = selector.match(/^(.*):has-text\\("(.*)"\\)$/);
+    if (hasText) {
+      const needle = normalise(hasText[2]);
+      el = [...document.querySelectorAll(hasText[1] || '*')].find(el => normalise(el.textContent).includes(needle)) || null;
+    } else {
+      try {
+        el = document.querySelector(selector);
+      } catch (err) {
+        el = null;
+      }
+    }
+    queried.set(selector, el);
+    return el;
+  };
+  const html = [];
+  const serialised = new Map();
+  const ref = el => {
+    if (!serialised.has(el)) {
+      serialised.set(el, html.length);
+      html.push(el.outerHTML);
+    }
+    return serialised.get(el);
+  };
+  const firstMatch = selectors => {
+    for (const selector of selectors) {
+      const el = query(selector);
+      if (el) return [selector, ref(el)];
+    }
+    return null;
+  };
+  return {
+    size: firstMatch(size),
+    colour: firstMatch(colour),
+    all_selects: [...document.querySelectorAll('select')].map(ref),
+    variation_containers: [...document.querySelectorAll('.x-msku__box-cont, [class*="variation"], [class*="msku"]')].map(ref),
+    html,
+    variations_script: (script => script ? [script.textContent.slice(0, sampleChars), script.textContent.length > sampleChars] : null)(
+      [...document.scripts].find(script => script.textContent.includes('itemVariationsMap'))
+    ),
+  };
+}
+"""
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
+    "Accept-Language": "en-GB,en-US;q=0.9,en;q=0.8",
+}
+
+VARIATIONS_MAP_RE = re.compile(r'"itemVariationsMap":\s*(\{.*?\})\s*,\s*"seoMetadata"', re.S)
+
+# Hosts whose server HTML once lacked the variation data; their later URLs
+# go straight to the browser
+STATIC_MISSES = set()
+
+# Characters kept for the report's sample section
+HTML_SAMPLE_CHARS = 50000
+
+def html_sample(text, kind, truncated=None):
+    """Return the report sample fields for ``text``, cut to HTML_SAMPLE_CHARS."""
+    return {
+        'html_sample': text[:HTML_SAMPLE_CHARS],
+        'html_sample_kind': kind,
+        'html_sample_truncated': len(text) > HTML_SAMPLE_CHARS if truncated is None else truncated,
+    }
+
+def try_static_fetch(url):
+    """Probe the server HTML of ``url`` without a browser.
+
+    eBay usually inlines the variation controls and ``itemVariationsMap`` in
+    the page it serves. Returns None when they are missing or the fetch fails;
+    only a page that arrived without them marks its host in STATIC_MISSES, so
+    a network blip does not send the rest of the run to the browser.
+    """
+    try:
+        with request.urlopen(request.Request(url, headers=HEADERS), timeout=30) as resp:
+            html = resp.read().decode("utf-8", errors="ignore")
+    except OSError as exc:
+        print(f"Static fetch of {url} failed: {exc}")
+        return None
+
+    soup = BeautifulSoup(html, HTML_PARSER)
+    if not (VARIATIONS_MAP_RE.search(html) or soup.select_one('select.x-msku__select-box, .listbox__option[data-sku-value-name]')):
+        STATIC_MISSES.add(urlparse(url).netloc)
+        return None
+
+    # The report keeps the itemVariationsMap script, or the page when there is none
+    script = soup.find('script', string=lambda text: text is not None and 'itemVariationsMap' in text)
+
+    # As in PROBE_JS, each selector is queried once and each element
+    # serialised once, however many lists it appears in
+    queried = {}
+    serialised = {}
+
+    def markup(element):
+        if id(element) not in serialised:
+            serialised[id(element)] = str(element)
+        return serialised[id(element)]
+
+    def first_match(selectors):
+        for selector in selectors:
+            if selector not in queried:
+                # soupsieve spells Playwright's :has-text() as :-soup-contains()
+                queried[selector] = soup.select_one(selector.replace(":has-text(", ":-soup-contains("))
+            element = queried[selector]
+            if element is not None:
+                return selector, markup(element)
+        return None, None
+
+    size_selector_used, size_html = first_match(SIZE_SELECTORS)
+    colour_selector_used, colour_html = first_match(COLOUR_SELECTORS)
+    return {
+        'size_html': size_html,
+        'size_selector': size_selector_used,
+        'colour_html': colour_html,
+        'colour_selector': colour_selector_used,
+        'all_selects': list(enumerate(markup(el) for el in soup.select('select'))),
+        'variation_containers': list(enumerate(
+            markup(el) for el in soup.select('.x-msku__box-cont, [class*="variation"], [class*="msku"]')
+        )),
+        **(html_sample(script.string, 'VARIATIONS SCRIPT') if script is not None else html_sample(html, 'FULL PAGE HTML')),
+    }
+
+def fetch_ebay_dom_structure(urls):
+    """Probe each listing in ``urls``, returning results keyed by URL.
+
+    The server HTML is tried first; only listings it cannot answer are opened
+    in a browser, which is launched once for all of them and probes up to
+    MAX_CONCURRENCY pages at a time.
+    """
+    results = {}
+    browser_urls = []
+    for url in urls:
+        host = urlparse(url).netloc
+        data = None if host in STATIC_MISSES else try_static_fetch(url)
+        if data is None:
+            browser_urls.append(url)
         else:
-            f.write("No variation containers found.\n\n")
-        
-        # Key patterns to look for
-        f.write("=" * 80 + "\n")
-        f.write("KEY PATTERNS TO LOOK FOR\n")
-        f.write("=" * 80 + "\n")
-        f.write("1. Class names: Look for 'x-msku', 'variation', 'select-box'\n")
-        f.write("2. Data attributes: Look for data-testid, aria-*, role attributes\n")
-        f.write("3. Disabled items: Check for 'disabled' attribute, 'aria-disabled', or specific classes\n")
-        f.write("4. Option structure: Check if using <select>/<option> or custom dropdowns\n\n")
-        
-        # Save a portion of full HTML for reference
-        f.write("=" * 80 + "\n")
-        f.write("FULL PAGE HTML SAMPLE (First 50,000 characters)\n")
-        f.write("=" * 80 + "\n")
-        f.write(data['full_html'][:50000])
-        if len(data['full_html']) > 50000:
-            f.write("\n\n... (truncated for readability)")
+            print(f"Probed {url} from its server HTML")
+            results[url] = data
+
+    if not browser_urls:
+        return results
+    if async_playwright is None:
+        raise RuntimeError("Playwright is not installed. Run 'pip install playwright' and 'playwright install chromium'.")
+
+    results.update(zip(browser_urls, asyncio.run(probe_in_browser(browser_urls))))
+    return {url: results[url] for url in urls}
+
+async def probe_in_browser(urls, max_concurrency=MAX_CONCURRENCY):
+    """Probe ``urls`` on pages of one browser context, returning results in input order."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    async with async_playwright() as p:
+        # Launch the browser and its context once; each URL only opens a page
+        browser = await p.chromium.launch(headless=True)
+        try:
+            context = await browser.new_context()
+
+            async def one(url):
+                async with semaphore:
+                    page = await context.new_page()
+                    try:
+                        return await probe_page(page, url)
+                    finally:
+                        await page.close()
+
+            return await asyncio.gather(*(one(url) for url in urls))
+        finally:
+            await browser.close()
+
+async def probe_page(page, url):
+    print(f"Navigating to {url}...")
+    await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+
+    # Wait only until the variation controls exist; listings without any
+    # still go through the selector sweep below
+    print("Waiting for variation controls...")
+    try:
+        await page.wait_for_selector('select.x-msku__select-box, .listbox__option', timeout=8000, state='attached')
+    except PlaywrightTimeoutError:
+        print("No variation controls appeared, probing the page as loaded")
+
+    # Every selector probe, select box and variation container comes back
+    # from one evaluate call
+    found = await page.evaluate(PROBE_JS, {'size': SIZE_SELECTORS, 'colour': COLOUR_SELECTORS, 'sampleChars': HTML_SAMPLE_CHARS})
+    html = found['html']
+
+    print("\n=== Looking for Size dropdown ===")
+    size_selector_used, size_html = (found['size'][0], html[found['size'][1]]) if found['size'] else (None, None)
+    if size_selector_used:
+        print(f"Found with selector: {size_selector_used}")
+
+    print("\n=== Looking for Colour dropdown ===")
+    colour_selector_used, colour_html = (found['colour'][0], html[found['colour'][1]]) if found['colour'] else (None, None)
+    if colour_selector_used:
+        print(f"Found with selector: {colour_selector_used}")
+
+    print("\n=== Looking for all select boxes ===")
+    all_selects_html = list(enumerate(html[ref] for ref in found['all_selects']))
+    for i, _ in all_selects_html:
+        print(f"Found select box {i+1}")
+
+    print("\n=== Looking for variation containers ===")
+    variation_html = list(enumerate(html[ref] for ref in found['variation_containers']))
+    for i, _ in variation_html:
+        print(f"Found variation container {i+1}")
+
+    # The report only needs the itemVariationsMap script, which came back
+    # with the probe; the full page HTML is the fallback
+    if found['variations_script']:
+        script_text, truncated = found['variations_script']
+        sample = html_sample(script_text, 'VARIATIONS SCRIPT', truncated)
+    else:
+        print("\n=== No itemVariationsMap script, getting full page HTML ===")
+        sample = html_sample(await page.content(), 'FULL PAGE HTML')
+
+    return {
+        'size_html': size_html,
+        'size_selector': size_selector_used,
+        'colour_html': colour_html,
+        'colour_selector': colour_selector_used,
+        'all_selects': all_selects_html,
+        'variation_containers': variation_html,
+        **sample,
+    }
+
+def save_dom_analysis(data, url, suffix=""):
+    output_file = f"d:\\stock check scrapper\\dom_structure_analysis{suffix}.txt"
+    rule = "=" * 80 + "\n"
+
+    # Sections are collected and written in one call
+    parts = [
+        rule,
+        "EBAY DOM STRUCTURE ANALYSIS\n",
+        f"URL: {url}\n",
+        rule + "\n",
+    ]
+
+    # Size Dropdown Section
+    parts += [rule, "SIZE DROPDOWN SECTION\n", rule]
+    if data['size_html']:
+        parts += [f"Selector used: {data['size_selector']}\n\n", data['size_html'], "\n\n"]
+    else:
+        parts.append("Size dropdown not found with standard selectors.\n\n")
+
+    # Colour Dropdown Section
+    parts += [rule, "COLOUR DROPDOWN SECTION\n", rule]
+    if data['colour_html']:
+        parts += [f"Selector used: {data['colour_selector']}\n\n", data['colour_html'], "\n\n"]
+    else:
+        parts.append("Colour dropdown not found with standard selectors.\n\n")
+
+    # All Select Boxes Section
+    parts += [rule, "ALL SELECT BOXES FOUND ON PAGE\n", rule]
+    if data['all_selects']:
+        for i, html in data['all_selects']:
+            parts += [f"\n--- SELECT BOX #{i+1} ---\n", html, "\n\n"]
+    else:
+        parts.append("No select boxes found.\n\n")
+
+    # Variation Containers Section
+    parts += [rule, "VARIATION CONTAINERS\n", rule]
+    if data['variation_containers']:
+        for i, html in data['variation_containers']:
+            parts += [f"\n--- VARIATION CONTAINER #{i+1} ---\n", html[:2000]]  # Limit to first 2000 chars to keep file manageable
+            if len(html) > 2000:
+                parts.append("\n... (truncated)")
+            parts.append("\n\n")
+    else:
+        parts.append("No variation containers found.\n\n")
+
+    # Key patterns to look for
+    parts += [
+        rule,
+        "KEY PATTERNS TO LOOK FOR\n",
+        rule,
+        "1. Class names: Look for 'x-msku', 'variation', 'select-box'\n",
+        "2. Data attributes: Look for data-testid, aria-*, role attributes\n",
+        "3. Disabled items: Check for 'disabled' attribute, 'aria-disabled', or specific classes\n",
+        "4. Option structure: Check if using <select>/<option> or custom dropdowns\n\n",
+    ]
+
+    # Save a portion of full HTML for reference
+    parts += [rule, f"{data['html_sample_kind']} SAMPLE (First {HTML_SAMPLE_CHARS:,} characters)\n", rule, data['html_sample']]
+    if data['html_sample_truncated']:
+        parts.append("\n\n... (truncated for readability)")
+
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write("".join(parts))
     
     print(f"\nDOM structure analysis saved to: {output_file}")
 
 if __name__ == "__main__":
     print("Starting eBay DOM structure fetch...\n")
-    data = fetch_ebay_dom_structure()
-    save_dom_analysis(data)
+    results = fetch_ebay_dom_structure(URLS)
+    for url, data in results.items():
+        # A single listing keeps the original file name
+        suffix = "" if len(results) == 1 else "_" + url.rstrip("/").rsplit("/", 1)[-1]
+        save_dom_analysis(data, url, suffix)
     print("\nDone!")
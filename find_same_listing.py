@@ -1,9 +1,6 @@
-import pandas as pd
+from excel_cache import load_stock_sheet
 
-df = pd.read_excel("ECOMWITH YASIR STOCK PRODUCTS SHEET (1).xlsx")
-header = df.iloc[0]
-df.columns = [str(header.iloc[i]).strip() if isinstance(header.iloc[i], str) and header.iloc[i].strip() else col for i, col in enumerate(df.columns)]
-df = df.iloc[1:].reset_index(drop=True)
+df = load_stock_sheet("ECOMWITH YASIR STOCK PRODUCTS SHEET (1).xlsx", dtype={"LISTING LINK": "string"})
 
 # Find all rows with the same listing URL as rows 45-49
 target_url = "https://www.ebay.co.uk/itm/363486576357?var=633227768703"
@@ -11,13 +8,16 @@ target_url = "https://www.ebay.co.uk/itm/363486576357?var=633227768703"
 print("Looking for rows with the same listing URL:")
 print("="*100)
 
-same_listing_rows = df[df['LISTING LINK'] == target_url]
+# Missing columns show as N/A; plain tuples skip the per-row Series
+cols = ['Product Name', 'Colour', 'SIZE', 'STATUS']
+same_listing_rows = df.loc[df['LISTING LINK'].eq(target_url)]
+same_listing_rows = same_listing_rows.loc[:, ~same_listing_rows.columns.duplicated()].reindex(columns=cols, fill_value='N/A')
 
 print(f"Found {len(same_listing_rows)} rows with the same listing URL:")
-for idx, row in same_listing_rows.iterrows():
+for idx, product_name, colour, size, status in same_listing_rows.itertuples(index=True, name=None):
     excel_row = idx + 2  # Excel row number (1-based + header row)
     print(f"\nRow {excel_row} (DataFrame index {idx}):")
-    print(f"  Product Name: {row.get('Product Name', 'N/A')}")
-    print(f"  Colour: {row.get('Colour', 'N/A')}")
-    print(f"  SIZE: {row.get('SIZE', 'N/A')}")
-    print(f"  STATUS: {row.get('STATUS', 'N/A')}")
\ No newline at end of file
+    print(f"  Product Name: {product_name}")
+    print(f"  Colour: {colour}")
+    print(f"  SIZE: {size}")
+    print(f"  STATUS: {status}")
\ No newline at end of file
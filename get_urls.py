@@ -1,13 +1,12 @@
-import pandas as pd
+from excel_cache import load_sheet, load_stock_sheet
 
-df = pd.read_excel("ECOMWITH YASIR STOCK PRODUCTS SHEET (1).xlsx")
+df = load_sheet("ECOMWITH YASIR STOCK PRODUCTS SHEET (1).xlsx")
 print("Columns:", df.columns.tolist()[:10])
 print("\nFirst row (headers):")
 print(df.iloc[0].tolist()[:10])
 
-header_row = df.iloc[0]
-df.columns = [str(header_row.iloc[i]).strip() if isinstance(header_row.iloc[i], str) and header_row.iloc[i].strip() else col for i, col in enumerate(df.columns)]
-df = df.iloc[1:]
+# Same workbook, so this reuses the parse above
+df = load_stock_sheet("ECOMWITH YASIR STOCK PRODUCTS SHEET (1).xlsx")
 
 print("\nNew columns:", df.columns.tolist()[:10])
 
@@ -1,12 +1,8 @@
-import pandas as pd
 from pathlib import Path
 
-path = Path("ECOMWITH YASIR STOCK PRODUCTS SHEET (1).xlsx")
+from excel_cache import load_stock_sheet
 
-raw = pd.read_excel(path)
-header = raw.iloc[0]
-data = raw.iloc[1:].reset_index(drop=True)
-data.columns = [header.iloc[i].strip() if isinstance(header.iloc[i], str) and header.iloc[i].strip() else raw.columns[i] for i in range(len(raw.columns))]
+path = Path("ECOMWITH YASIR STOCK PRODUCTS SHEET (1).xlsx")
 
 cols = [
     "Sr No",
@@ -18,4 +14,4 @@ cols = [
     "ITEM NUMBER",
     "LISTING LINK",
 ]
-print(data[cols].head(10))
+print(load_stock_sheet(path, usecols=cols, nrows=10))
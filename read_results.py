@@ -1,10 +1,21 @@
+from itertools import islice
+
 import pandas as pd
+from openpyxl import load_workbook
+
+from excel_cache import EXCEL_ENGINE
 
-results = pd.read_excel('results_top15.xlsx')
+# calamine when installed, openpyxl otherwise
+results = pd.read_excel('results_top15.xlsx', engine=EXCEL_ENGINE)
 print(results[['row_index', 'listing_url', 'detected_status', 'error']])
 print('\nSummary:')
 print(results['detected_status'].value_counts())
 
-copy_df = pd.read_excel('sheet_top15_updated.xlsx', header=None)
+# Only the first rows are shown, so stream just those instead of parsing the sheet
+copy_wb = load_workbook('sheet_top15_updated.xlsx', read_only=True, data_only=True)
+try:
+    copy_df = pd.DataFrame(islice(copy_wb.active.iter_rows(values_only=True), 10))
+finally:
+    copy_wb.close()
 print('\nUpdated sheet preview:')
-print(copy_df.head(10))
+print(copy_df)
@@ -1,24 +1,8 @@
-def extract_base_colour(colour_text):
-    text = colour_text.strip()
-    
-    # Handle "GelBack-Pink" format (prefix-colour) -> extract "pink"
-    if text.lower().startswith('gelback-') or text.lower().startswith('gel back-'):
-        parts = text.split('-', 1)
-        if len(parts) == 2:
-            return parts[1].strip().lower()
-    
-    # Handle "Pink - Gel Back 59" format (colour - suffix) -> extract "pink"
-    if ' - ' in text:
-        base = text.split(' - ')[0].strip()
-        return base.lower()
-    
-    # Handle "GelBack Pink" format (prefix space colour) -> extract "pink"
-    if text.lower().startswith('gelback ') or text.lower().startswith('gel back '):
-        parts = text.split(' ', 1)
-        if len(parts) == 2:
-            return parts[1].strip().lower()
-    
-    return text.lower()
+import sys
+sys.path.append('.')
+
+# Exercise the scraper's own matcher rather than a copy of it
+from ebay_stock_scraper import extract_base_colour
 
 tests = [
     ('GelBack-Pink', 'Pink - Gel Back 59'),
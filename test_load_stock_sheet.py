@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+"""Test load_stock_sheet header promotion, including an all-numeric header row."""
+
+import sys
+import tempfile
+sys.path.append('.')
+
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from excel_cache import load_stock_sheet
+
+def write_sheet(path, rows):
+    wb = Workbook()
+    ws = wb.active
+    for row in rows:
+        ws.append(row)
+    wb.save(path)
+
+def test_promotes_string_labels():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "labels.xlsx"
+        write_sheet(path, [["a", "b", "c"], [" Colour ", "", 5], ["Red", "x", 1]])
+        df = load_stock_sheet(path)
+        # Blank and non-string labels keep the original column name
+        assert list(df.columns) == ["Colour", "b", "c"], list(df.columns)
+        assert df.iloc[0].tolist() == ["Red", "x", 1], df.iloc[0].tolist()
+
+def test_all_numeric_header_row():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "numeric.xlsx"
+        write_sheet(path, [["a", "b"], [1.5, 2.5], [3.5, 4.5]])
+        df = load_stock_sheet(path)
+        assert list(df.columns) == ["a", "b"], list(df.columns)
+        assert df.iloc[0].tolist() == [3.5, 4.5], df.iloc[0].tolist()
+
+if __name__ == "__main__":
+    test_promotes_string_labels()
+    test_all_numeric_header_row()
+    print("Test result: PASS")
@@ -1,14 +1,18 @@
-import subprocess
 import sys
 
+from ebay_stock_scraper import main
+
+# Rows are checked in parallel browser contexts; well under eBay's ~8
+# concurrent sessions
+WORKERS = 4
+
 # Test row 46: 60 x 110 cm + Green Cream - Greekey (should be OUT_OF_STOCK)
-cmd = [
-    sys.executable,
-    "ebay_stock_scraper.py",
+argv = [
     "--excel", "ECOMWITH YASIR STOCK PRODUCTS SHEET (1).xlsx",
     "--engine", "chromium",
     "--chromium-profile", "./chromium_profile",
     "--limit", "47",  # Process up to row 47
+    "--workers", str(WORKERS),
     "--verbose",
     "--delay", "3",
     "--output", "test_row46.xlsx"
@@ -18,4 +22,5 @@ print("Testing row 46 (60 x 110 cm + Green Cream - Greekey)")
 print("This should detect OUT_OF_STOCK")
 print("=" * 80)
 
-subprocess.run(cmd)
+# Called in-process: no second interpreter start or scraper import
+sys.exit(main(argv))
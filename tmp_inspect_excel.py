@@ -1,4 +1,3 @@
-import itertools
 import string
 
 import pandas as pd
@@ -6,13 +5,27 @@ from openpyxl import load_workbook
 
 path = r"d:\stock check scrapper\ECOMWITH YASIR STOCK PRODUCTS SHEET (1).xlsx"
 
-# OpenPyXL view for raw rows --------------------------------------------------
+# One streaming pass over the sheet: rows are buffered while scanning for the
+# header, and both the raw preview and the data rows are sliced from the buffer
 wb = load_workbook(path, read_only=True, data_only=True)
 ws = wb.active
 
+rows = []
+header_idx = None
+for row in ws.iter_rows(values_only=True):
+    rows.append(row)
+    if header_idx is None:
+        values = {"" if value is None else str(value).strip() for value in row}
+        if "LISTING NUMBER" in values and "LISTING LINK" in values:
+            header_idx = len(rows) - 1
+    if header_idx is not None and len(rows) >= max(header_idx + 9, 8):
+        break
+
+wb.close()
+
 print("Raw worksheet preview (first 12 columns, first 8 rows):")
 cols = list(string.ascii_uppercase[:12]) + ["L", "M", "N", "O", "P"]
-for row_idx, row in enumerate(itertools.islice(ws.iter_rows(values_only=True), 8), start=1):
+for row_idx, row in enumerate(rows[:8], start=1):
     row_values = []
     for col_idx, value in enumerate(row, start=1):
         # limit preview to first 16 columns to keep output manageable
@@ -27,22 +40,10 @@ for row_idx, row in enumerate(itertools.islice(ws.iter_rows(values_only=True), 8
         row_values.append(f"{column_letter}:{value}")
     print(f"Row {row_idx}: {row_values}")
 
-wb.close()
-
-# Pandas-based structure detection -------------------------------------------
-df = pd.read_excel(path, header=None)
-
-header_idx = None
-for idx, row in df.iterrows():
-    values = row.fillna("").astype(str).str.strip()
-    if "LISTING NUMBER" in values.values and "LISTING LINK" in values.values:
-        header_idx = idx
-        break
-
 if header_idx is None:
     raise RuntimeError("Unable to locate header row containing key labels")
 
-headers = df.iloc[header_idx]
+headers = rows[header_idx]
 
 print(f"\nDetected header row index: {header_idx}")
 print("Column overview (index -> letter -> header):")
@@ -56,11 +57,10 @@ for idx, value in enumerate(headers, start=1):
     print(f"{idx:>02} -> {column_letter}: {value}")
 
 print("\nFirst 8 data rows after header:")
-data_rows = df.iloc[header_idx + 1: header_idx + 9]
-print(data_rows)
+data_rows = rows[header_idx + 1: header_idx + 9]
+print(pd.DataFrame(data_rows, index=range(header_idx + 1, header_idx + 1 + len(data_rows))))
 
 print("\nRow dict samples (non-empty fields):")
-for idx, row in data_rows.iterrows():
-    row_dict = {headers[i]: row[i] for i in range(len(headers)) if pd.notna(row[i])}
+for idx, row in enumerate(data_rows, start=header_idx + 1):
+    row_dict = {headers[i]: value for i, value in enumerate(row[:len(headers)]) if value is not None}
     print(idx, row_dict)
-
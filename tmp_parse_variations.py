@@ -1,5 +1,5 @@
-from urllib import request
-from bs4 import BeautifulSoup
+import lxml.html
+import requests
 import re
 import json
 
@@ -8,9 +8,20 @@ headers = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
     "Accept-Language": "en-GB,en-US;q=0.9,en;q=0.8",
 }
-req = request.Request(url, headers=headers)
-with request.urlopen(req) as resp:
-    html_bytes = resp.read()
+
+# Keep-alive session, reused for every listing fetched from this module
+SESSION = requests.Session()
+SESSION.headers.update(headers)
+
+# XPath twin of '.listbox__option[data-sku-value-name]' (lxml's cssselect()
+# needs the separate cssselect package)
+SKU_OPTION_XPATH = '//*[contains(concat(" ", normalize-space(@class), " "), " listbox__option ")][@data-sku-value-name]'
+
+# Compiled once and run on the raw bytes; only the matched map is decoded
+VARIATIONS_MAP_RE = re.compile(rb'"itemVariationsMap":\s*(\{.*?\})\s*,\s*"seoMetadata"', re.S)
+
+resp = SESSION.get(url, timeout=30)
+html_bytes = resp.content
 html = html_bytes.decode("utf-8", errors="ignore")
 
 with open("sample_listing.html", "wb") as fh:
@@ -18,11 +29,13 @@ with open("sample_listing.html", "wb") as fh:
 
 print("html len", len(html))
 
-match = re.search(r'"itemVariationsMap":\s*(\{.*?\})\s*,\s*"seoMetadata"', html, re.S)
+# Jump straight to the first mention instead of scanning the whole body
+start = html_bytes.find(b'"itemVariationsMap"')
+match = VARIATIONS_MAP_RE.search(html_bytes, start) if start != -1 else None
 if not match:
     print("variations map not found via regex")
 else:
-    data = match.group(1)
+    data = match.group(1).decode("utf-8", errors="ignore")
     print("map snippet len", len(data))
     try:
         obj = json.loads('{"itemVariationsMap":' + data + '}' )
@@ -30,9 +43,9 @@ else:
     except json.JSONDecodeError as exc:
         print("json decode error", exc)
 
-soup = BeautifulSoup(html, "html.parser")
-for script in soup.find_all("script"):
-    text = script.string or script.text
+doc = lxml.html.fromstring(html)
+for script in doc.iter("script"):
+    text = script.text_content()
     if not text:
         continue
     if "itemVariationsMap" in text:
@@ -43,7 +56,7 @@ for script in soup.find_all("script"):
 else:
     print("no script tag with variations map")
 
-sku_options = soup.select('.listbox__option[data-sku-value-name]')
+sku_options = doc.xpath(SKU_OPTION_XPATH)
 print("found sku options", len(sku_options))
 if sku_options:
-    print([opt['data-sku-value-name'] for opt in sku_options[:5]])
+    print([opt.get('data-sku-value-name') for opt in sku_options[:5]])
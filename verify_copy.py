@@ -14,13 +14,22 @@ print("Copy rows:", copy_ws.max_row)
 print("Original cols:", src_ws.max_column)
 print("Copy cols:", copy_ws.max_column)
 
+# One pass over the first 11 rows and 14 columns of each sheet; short rows
+# and missing rows read as None, like ws.cell() on an empty cell
+def read_block(ws, max_row=11, max_col=14):
+    rows = [tuple(row) + (None,) * (max_col - len(row)) for row in ws.iter_rows(min_row=1, max_row=max_row, max_col=max_col, values_only=True)]
+    return rows + [(None,) * max_col] * (max_row - len(rows))
+
+src_rows = read_block(src_ws)
+copy_rows = read_block(copy_ws)
+
 for row_idx in range(1, 6):
-    src_row = [src_ws.cell(row=row_idx, column=col_idx).value for col_idx in range(1, 6)]
-    copy_row = [copy_ws.cell(row=row_idx, column=col_idx).value for col_idx in range(1, 6)]
+    src_row = list(src_rows[row_idx - 1][:5])
+    copy_row = list(copy_rows[row_idx - 1][:5])
     print(f"Row {row_idx} src : {src_row}")
     print(f"Row {row_idx} copy: {copy_row}")
 
-status_src = [src_ws.cell(row=r, column=14).value for r in range(1, 12)]
-status_copy = [copy_ws.cell(row=r, column=14).value for r in range(1, 12)]
+status_src = [row[13] for row in src_rows]
+status_copy = [row[13] for row in copy_rows]
 print("Status src  :", status_src)
 print("Status copy :", status_copy)
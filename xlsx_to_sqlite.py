@@ -0,0 +1,138 @@
+"""Convert a stock workbook into an indexed SQLite sidecar.
+
+The check scripts look up a handful of sheet rows at a time. Once the workbook
+has been streamed into ``<name>.xlsx.sqlite`` those lookups become indexed
+queries instead of a full XLSX parse.
+
+Layout:
+    products(excel_row INTEGER PRIMARY KEY, col_a, col_b, ...)
+        One row per sheet row; ``excel_row`` is the 1-based sheet row number.
+    headers(letter TEXT PRIMARY KEY, label TEXT)
+        Column labels resolved the same way the scraper does: the header
+        labels on sheet row 2, falling back to sheet row 1.
+
+Usage:
+    python xlsx_to_sqlite.py "ECOMWITH YASIR STOCK PRODUCTS SHEET (1).xlsx"
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Sequence
+
+try:  # pragma: no cover - optional dependency, faster streaming reader
+    from python_calamine import CalamineWorkbook  # type: ignore
+except ImportError:  # pragma: no cover
+    CalamineWorkbook = None  # type: ignore
+
+
+def sidecar_path_for(path: Path) -> Path:
+    return path.with_name(path.name + ".sqlite")
+
+
+def column_letter(index: int) -> str:
+    """Return the sheet column letter for a 1-based column index."""
+    letters = []
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters.append(chr(ord("A") + rem))
+    return "".join(reversed(letters))
+
+
+def iter_sheet_rows(path: Path) -> Iterator[Sequence[Any]]:
+    if CalamineWorkbook is not None:
+        yield from CalamineWorkbook.from_path(str(path)).get_sheet_by_index(0).iter_rows()
+        return
+
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield from wb.active.iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def to_sql_value(value: Any) -> Any:
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float, str)):
+        return value
+    return str(value)
+
+
+def resolve_labels(first_row: Sequence[Any], second_row: Sequence[Any]) -> List[Optional[str]]:
+    labels: List[Optional[str]] = []
+    for idx in range(max(len(first_row), len(second_row))):
+        label = None
+        for candidate in (second_row[idx] if idx < len(second_row) else None,
+                          first_row[idx] if idx < len(first_row) else None):
+            if isinstance(candidate, str) and candidate.strip():
+                label = candidate.strip()
+                break
+        labels.append(label)
+    return labels
+
+
+def build_sidecar(path: Path) -> Path:
+    """Stream ``path`` into its SQLite sidecar and return the sidecar path."""
+    if not path.exists():
+        raise FileNotFoundError(path)
+
+    rows = iter_sheet_rows(path)
+    head = list(itertools.islice(rows, 2))
+    width = max((len(row) for row in head), default=0)
+    letters = [column_letter(idx) for idx in range(1, width + 1)]
+    labels = resolve_labels(head[0] if head else (), head[1] if len(head) > 1 else ())
+
+    sidecar = sidecar_path_for(path)
+    tmp_path = sidecar.with_name(sidecar.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        columns = ", ".join(f"col_{letter.lower()}" for letter in letters)
+        conn.execute(f"CREATE TABLE products (excel_row INTEGER PRIMARY KEY, {columns})")
+        conn.execute("CREATE TABLE headers (letter TEXT PRIMARY KEY, label TEXT)")
+        conn.executemany("INSERT INTO headers VALUES (?, ?)", zip(letters, labels))
+
+        placeholders = ", ".join("?" * (width + 1))
+
+        def padded(excel_row: int, row: Sequence[Any]) -> List[Any]:
+            values = [to_sql_value(value) for value in row[:width]]
+            return [excel_row, *values, *([None] * (width - len(values)))]
+
+        conn.executemany(
+            f"INSERT INTO products VALUES ({placeholders})",
+            (padded(excel_row, row) for excel_row, row in enumerate(itertools.chain(head, rows), start=1)),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp_path, sidecar)
+    return sidecar
+
+
+def open_sidecar(path: Path) -> Optional[sqlite3.Connection]:
+    """Return a connection to the sidecar of ``path`` if it is newer than the workbook."""
+    sidecar = sidecar_path_for(path)
+    if not sidecar.exists() or os.path.getmtime(sidecar) < os.path.getmtime(path):
+        return None
+    return sqlite3.connect(f"{sidecar.resolve().as_uri()}?mode=ro", uri=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Convert a stock workbook into an indexed SQLite sidecar.")
+    parser.add_argument("excel", type=Path, help="Path to the Excel workbook to convert.")
+    args = parser.parse_args(argv)
+    sidecar = build_sidecar(args.excel)
+    print(f"SQLite sidecar written to {sidecar}")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())